@@ -13,6 +13,8 @@ from .config import Settings, load_settings
 from .db import Database
 from .ingestion import ingest_from_path
 from .schemas import (
+    BatchRecommendationRequest,
+    BatchRecommendationResponse,
     ConversationResponse,
     HistoryResponse,
     IngestRequest,
@@ -46,13 +48,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     app.state.settings = settings
     app.state.database = database
+    # Built once: ChatOpenAI client construction is too expensive per request.
+    app.state.advisor_llm = FinanceAdvisorAgent._init_llm(settings)
 
     @app.get("/health", tags=["system"])
     async def health() -> Dict[str, str]:
         return {"status": "ok", "environment": settings.environment}
 
     @app.post("/ingest", tags=["data"], response_model=Dict[str, Any])
-    async def ingest_data(
+    def ingest_data(
         request: IngestRequest, service: FinanceService = Depends(get_service)
     ) -> Dict[str, Any]:
         try:
@@ -71,7 +75,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     @app.get("/users", tags=["data"], response_model=List[UserResponse])
-    async def list_users(service: FinanceService = Depends(get_service)) -> List[UserResponse]:
+    def list_users(service: FinanceService = Depends(get_service)) -> List[UserResponse]:
         users = service.get_users()
         return [
             UserResponse(id=user.id, name=user.name, income_monthly=user.income_monthly, risk_tolerance=user.risk_tolerance)
@@ -84,7 +88,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         advisor: FinanceAdvisorAgent = Depends(get_advisor),
     ) -> RecommendationResponse:
         try:
-            result = advisor.recommend(payload.user_id, payload.question or "")
+            result = await advisor.arecommend(payload.user_id, payload.question or "")
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
         return RecommendationResponse(
@@ -97,8 +101,34 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             monthly_projection=result.monthly_projection,
         )
 
+    @app.post("/recommend/batch", tags=["advisor"], response_model=BatchRecommendationResponse)
+    def recommend_batch(
+        payload: BatchRecommendationRequest,
+        advisor: FinanceAdvisorAgent = Depends(get_advisor),
+    ) -> BatchRecommendationResponse:
+        try:
+            results = advisor.recommend_many(
+                [(item.user_id, item.question or "") for item in payload.items]
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        return BatchRecommendationResponse(
+            items=[
+                RecommendationResponse(
+                    user_id=item.user_id,
+                    question=item.question or "",
+                    summary=result.summary,
+                    recommended_actions=result.recommended_actions,
+                    investment_split=result.investment_split,
+                    savings_rate=result.savings_rate,
+                    monthly_projection=result.monthly_projection,
+                )
+                for item, result in zip(payload.items, results)
+            ]
+        )
+
     @app.get("/history/{user_id}", tags=["advisor"], response_model=HistoryResponse)
-    async def history(user_id: int, service: FinanceService = Depends(get_service)) -> HistoryResponse:
+    def history(user_id: int, service: FinanceService = Depends(get_service)) -> HistoryResponse:
         try:
             items = service.get_recent_conversations(user_id, limit=settings.memory_window)
         except ValueError as exc:
@@ -150,7 +180,10 @@ def get_service(session: Session = Depends(get_session)) -> FinanceService:
 
 
 def get_advisor(
-    settings: Settings = Depends(get_settings),
+    request: Request,
     service: FinanceService = Depends(get_service),
 ) -> FinanceAdvisorAgent:
-    return FinanceAdvisorAgent(settings=settings, service=service)
+    # Read app.state directly instead of nesting Depends(get_settings); one
+    # less dependency for Starlette to resolve on every /recommend.
+    state = request.app.state
+    return FinanceAdvisorAgent(settings=state.settings, service=service, llm=state.advisor_llm)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Iterator
 
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from .config import Settings
@@ -13,11 +14,20 @@ class Database:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.engine = create_engine(
-            settings.database_url,
-            echo=False,
-            connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-        )
+        engine_kwargs: dict = {"echo": False, "query_cache_size": 1200}
+        if "sqlite" in settings.database_url:
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+            if ":memory:" in settings.database_url:
+                # A single shared connection keeps the in-memory schema alive.
+                engine_kwargs["poolclass"] = StaticPool
+        else:
+            engine_kwargs.update(
+                pool_size=20,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+            )
+        self.engine = create_engine(settings.database_url, **engine_kwargs)
 
     def create_schema(self) -> None:
         SQLModel.metadata.create_all(self.engine)
@@ -1,32 +1,51 @@
 from __future__ import annotations
 
-import csv
 import argparse
+import itertools
 import json
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator
 
+import pandas as pd
 from sqlmodel import Session, select
 
 from .config import Settings
 from .models import Goal, Transaction, User
 
+# Flush interval while streaming large CSVs, to bound session memory.
+FLUSH_EVERY = 10_000
 
-def load_csv(path: Path) -> List[Dict[str, str]]:
-    with path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return [row for row in reader]
+# Numeric columns coerced once by pandas' C parser instead of per-row
+# int()/float() calls; goal columns stay as strings because they may be blank.
+_CSV_DTYPES = {"user_id": "int64", "amount": "float64", "income_monthly": "float64"}
 
 
-def ingest_transactions(session: Session, rows: Iterable[Dict[str, str]]) -> Dict[str, int]:
+def load_csv(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream CSV rows lazily so ingestion never holds the whole file in memory."""
+    for chunk in pd.read_csv(path, dtype=_CSV_DTYPES, na_filter=False, chunksize=FLUSH_EVERY):
+        yield from chunk.to_dict("records")
+
+
+def ingest_transactions(session: Session, rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
     metrics = {"users": 0, "transactions": 0, "goals": 0}
-    seen_users = {}
 
+    # Resolve existing users and goals in two bulk queries up front instead
+    # of one SELECT per CSV row. Rows may be a lazy stream, so we load the
+    # (small) app-side tables rather than pre-scanning the file.
+    known_users = set(session.exec(select(User.id)).all())
+    existing_goals = {
+        (goal_user_id, goal_name)
+        for goal_user_id, goal_name in session.exec(select(Goal.user_id, Goal.name)).all()
+    }
+
+    seen_users = set()
+    # Transactions bypass the ORM unit of work: buffered dicts go through
+    # bulk_insert_mappings as multi-row INSERTs.
+    txn_batch: list = []
     for row in rows:
         user_id = int(row["user_id"])
         if user_id not in seen_users:
-            user = session.get(User, user_id)
-            if not user:
+            if user_id not in known_users:
                 user = User(
                     id=user_id,
                     name=row["name"],
@@ -35,34 +54,38 @@ def ingest_transactions(session: Session, rows: Iterable[Dict[str, str]]) -> Dic
                 )
                 session.add(user)
                 metrics["users"] += 1
-            seen_users[user_id] = user
+            seen_users.add(user_id)
 
-            # Goals might be repeated in CSV; ensure uniqueness per goal name
+            # Goals might be repeated in CSV; uniqueness per goal name is an
+            # O(1) membership test against existing_goals, never a SELECT.
             goal_name = row.get("goal_name")
-            if goal_name:
-                existing_goal = session.exec(
-                    select(Goal).where(Goal.user_id == user_id, Goal.name == goal_name)
-                ).first()
-                if not existing_goal:
-                    goal = Goal(
-                        user_id=user_id,
-                        name=goal_name,
-                        target_amount=float(row.get("goal_target", 0) or 0),
-                        timeline_months=int(row.get("goal_timeline_months", 12) or 12),
-                    )
-                    session.add(goal)
-                    metrics["goals"] += 1
-
-        transaction = Transaction(
-            user_id=user_id,
-            category=row.get("category", "uncategorized"),
-            amount=float(row["amount"]),
-            type=row.get("type", "expense"),
-            month=row.get("month", "2025-01"),
+            if goal_name and (user_id, goal_name) not in existing_goals:
+                goal = Goal(
+                    user_id=user_id,
+                    name=goal_name,
+                    target_amount=float(row.get("goal_target", 0) or 0),
+                    timeline_months=int(row.get("goal_timeline_months", 12) or 12),
+                )
+                session.add(goal)
+                existing_goals.add((user_id, goal_name))
+                metrics["goals"] += 1
+
+        txn_batch.append(
+            {
+                "user_id": user_id,
+                "category": row.get("category", "uncategorized"),
+                "amount": float(row["amount"]),
+                "type": row.get("type", "expense"),
+                "month": row.get("month", "2025-01"),
+            }
         )
-        session.add(transaction)
         metrics["transactions"] += 1
+        if len(txn_batch) >= FLUSH_EVERY:
+            session.bulk_insert_mappings(Transaction, txn_batch)
+            txn_batch.clear()
 
+    if txn_batch:
+        session.bulk_insert_mappings(Transaction, txn_batch)
     session.commit()
     return metrics
 
@@ -72,9 +95,10 @@ def ingest_from_path(settings: Settings, session: Session, path: Path | None = N
     if not target.exists():
         raise FileNotFoundError(f"CSV file not found: {target}")
     rows = load_csv(target)
-    if not rows:
+    first = next(rows, None)
+    if first is None:
         raise ValueError(f"CSV file {target} is empty.")
-    return ingest_transactions(session, rows)
+    return ingest_transactions(session, itertools.chain([first], rows))
 
 
 def parse_args() -> argparse.Namespace:
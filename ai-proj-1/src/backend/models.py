@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -15,7 +16,7 @@ class User(SQLModel, table=True):
 
 class Transaction(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="user.id")
+    user_id: int = Field(foreign_key="user.id", index=True)
     category: str
     amount: float
     type: str = Field(default="expense")  # expense or income
@@ -24,13 +25,16 @@ class Transaction(SQLModel, table=True):
 
 class Goal(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="user.id")
+    user_id: int = Field(foreign_key="user.id", index=True)
     name: str
     target_amount: float
     timeline_months: int
 
 
 class Conversation(SQLModel, table=True):
+    # Composite index serves the per-user ORDER BY created_at DESC LIMIT query.
+    __table_args__ = (Index("ix_conv_user_created", "user_id", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
     question: str
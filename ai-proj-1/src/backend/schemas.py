@@ -37,6 +37,14 @@ class RecommendationResponse(BaseModel):
     monthly_projection: float
 
 
+class BatchRecommendationRequest(BaseModel):
+    items: List[RecommendationRequest] = Field(..., min_length=1)
+
+
+class BatchRecommendationResponse(BaseModel):
+    items: List[RecommendationResponse]
+
+
 class ConversationResponse(BaseModel):
     id: int
     user_id: int
@@ -3,53 +3,94 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from .models import Conversation, Goal, Transaction, User
 
+# Hoisted to module scope so the presets are built once, not per call.
+_ALLOCATION_PRESETS: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    "conservative": (("High-yield savings", 50), ("Bond ETF", 30), ("Broad market ETF", 20)),
+    "moderate": (("High-yield savings", 30), ("Bond ETF", 30), ("Broad market ETF", 30), ("Thematic ETF", 10)),
+    "aggressive": (("High-yield savings", 15), ("Broad market ETF", 45), ("International ETF", 25), ("Emerging markets", 15)),
+}
+
 
 class FinanceService:
     """Business logic for financial calculations and persistence."""
 
     def __init__(self, session: Session):
         self.session = session
+        # Memoizes read methods for the lifetime of this service (one request);
+        # cleared whenever a write goes through.
+        self._cache: Dict[Tuple, object] = {}
+
+    def _cached(self, key: Tuple, loader):
+        if key not in self._cache:
+            self._cache[key] = loader()
+        return self._cache[key]
 
     # -------- User & Data retrieval -------- #
-    def get_users(self) -> List[User]:
-        return self.session.exec(select(User)).all()
+    def get_users(self) -> List[Tuple[int, str, float, str]]:
+        # Column-only select: rows come back as named tuples without ORM
+        # hydration or identity-map registration.
+        return self._cached(
+            ("users",),
+            lambda: self.session.exec(
+                select(User.id, User.name, User.income_monthly, User.risk_tolerance)
+            ).all(),
+        )
 
     def get_user(self, user_id: int) -> User:
-        user = self.session.get(User, user_id)
+        user = self._cached(("user", user_id), lambda: self.session.get(User, user_id))
         if not user:
+            self._cache.pop(("user", user_id), None)
             raise ValueError(f"User {user_id} not found")
         return user
 
     def get_transactions(self, user_id: int) -> List[Transaction]:
-        return self.session.exec(select(Transaction).where(Transaction.user_id == user_id)).all()
+        return self._cached(
+            ("transactions", user_id),
+            lambda: self.session.exec(
+                select(Transaction).where(Transaction.user_id == user_id)
+            ).all(),
+        )
 
     def get_goals(self, user_id: int) -> List[Goal]:
-        return self.session.exec(select(Goal).where(Goal.user_id == user_id)).all()
+        return self._cached(
+            ("goals", user_id),
+            lambda: self.session.exec(select(Goal).where(Goal.user_id == user_id)).all(),
+        )
 
     def get_recent_conversations(self, user_id: int, limit: int = 5) -> List[Conversation]:
-        return (
-            self.session.exec(
+        return self._cached(
+            ("conversations", user_id, limit),
+            lambda: self.session.exec(
                 select(Conversation)
                 .where(Conversation.user_id == user_id)
                 .order_by(Conversation.created_at.desc())
                 .limit(limit)
-            )
-            .all()
+            ).all(),
         )
 
     # -------- Calculations -------- #
     def calculate_financial_snapshot(self, user_id: int) -> Dict[str, float]:
-        transactions = self.get_transactions(user_id)
-        income = sum(t.amount for t in transactions if t.type == "income")
-        expenses = sum(t.amount for t in transactions if t.type != "income")
+        # Aggregate in SQL so only O(categories) rows come back instead of
+        # hydrating every transaction into an ORM object; the single loop
+        # below fills income, expenses, and per-category totals in one pass.
+        totals = self.session.exec(
+            select(Transaction.type, Transaction.category, func.sum(Transaction.amount))
+            .where(Transaction.user_id == user_id)
+            .group_by(Transaction.type, Transaction.category)
+        ).all()
+        income = 0.0
+        expenses = 0.0
         category_totals: Dict[str, float] = defaultdict(float)
-        for txn in transactions:
-            if txn.type != "income":
-                category_totals[txn.category] += txn.amount
+        for txn_type, category, total in totals:
+            if txn_type == "income":
+                income += total
+            else:
+                expenses += total
+                category_totals[category] += total
 
         savings_rate = 0.0
         disposable = income - expenses
@@ -74,13 +115,8 @@ class FinanceService:
             )
         return summaries
 
-    def determine_investment_allocation(self, risk_tolerance: str) -> List[Tuple[str, int]]:
-        presets = {
-            "conservative": [("High-yield savings", 50), ("Bond ETF", 30), ("Broad market ETF", 20)],
-            "moderate": [("High-yield savings", 30), ("Bond ETF", 30), ("Broad market ETF", 30), ("Thematic ETF", 10)],
-            "aggressive": [("High-yield savings", 15), ("Broad market ETF", 45), ("International ETF", 25), ("Emerging markets", 15)],
-        }
-        return presets.get(risk_tolerance.lower(), presets["moderate"])
+    def determine_investment_allocation(self, risk_tolerance: str) -> Tuple[Tuple[str, int], ...]:
+        return _ALLOCATION_PRESETS.get(risk_tolerance.lower(), _ALLOCATION_PRESETS["moderate"])
 
     # -------- Persistence -------- #
     def record_conversation(self, user_id: int, question: str, answer: str) -> Conversation:
@@ -88,4 +124,5 @@ class FinanceService:
         self.session.add(convo)
         self.session.commit()
         self.session.refresh(convo)
+        self._cache.clear()
         return convo
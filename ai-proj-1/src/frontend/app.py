@@ -10,25 +10,41 @@ class FinanceApiClient:
 
     def __init__(self, base_url: str = "http://localhost:8001"):
         self.base_url = base_url.rstrip("/")
+        # One pooled client per FinanceApiClient: keep-alive connections skip
+        # the TCP+TLS handshake on every call.
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> "FinanceApiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def get_users(self) -> List[Dict[str, Any]]:
-        response = httpx.get(f"{self.base_url}/users", timeout=10)
+        response = self._client.get("/users")
         response.raise_for_status()
         return response.json()
 
     def get_history(self, user_id: int) -> List[Dict[str, Any]]:
-        response = httpx.get(f"{self.base_url}/history/{user_id}", timeout=10)
+        response = self._client.get(f"/history/{user_id}")
         response.raise_for_status()
         return response.json()["items"]
 
     def recommend(self, user_id: int, question: Optional[str] = None) -> Dict[str, Any]:
         payload = {"user_id": user_id, "question": question}
-        response = httpx.post(f"{self.base_url}/recommend", json=payload, timeout=30)
+        response = self._client.post("/recommend", json=payload)
         response.raise_for_status()
         return response.json()
 
     def ingest(self, path: Optional[str] = None) -> Dict[str, Any]:
         payload = {"path": path}
-        response = httpx.post(f"{self.base_url}/ingest", json=payload, timeout=30)
+        response = self._client.post("/ingest", json=payload)
         response.raise_for_status()
         return response.json()
@@ -5,11 +5,12 @@ from typing import Any, Dict, Iterator, Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlmodel import Session
 
 from .config import Settings, load_settings
 from .db import Database
+from .github_client import GitHubClient
 from .models import Issue, Review
 from .schemas import (
     HealthResponse,
@@ -29,7 +30,14 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
     database = Database(settings)
     database.create_schema()
 
-    app = FastAPI(title=settings.app_name, version="1.0.0", description="AI Code Reviewer Agent")
+    app = FastAPI(
+        title=settings.app_name,
+        version="1.0.0",
+        description="AI Code Reviewer Agent",
+        # orjson serializes the datetime-heavy review payloads several times
+        # faster than stdlib json.
+        default_response_class=ORJSONResponse,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -40,6 +48,13 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
 
     app.state.settings = settings
     app.state.database = database
+    # Shared across requests: keep-alive connections to GitHub amortize the
+    # TCP+TLS handshake instead of paying it on every /review.
+    app.state.github_client = GitHubClient(settings)
+
+    @app.on_event("shutdown")
+    async def close_github_client() -> None:  # pragma: no cover
+        await app.state.github_client.close()
 
     @app.get("/health", response_model=HealthResponse, tags=["system"])
     async def health() -> HealthResponse:
@@ -51,7 +66,7 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         service: ReviewService = Depends(get_service),
     ) -> ReviewResponse:
         try:
-            return service.perform_review(payload)
+            return await service.perform_review(payload)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
@@ -72,9 +87,9 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
                 file_path=review.file_path,
                 summary=review.summary,
                 created_at=review.created_at,
-                issue_count=len(review.issues),
+                issue_count=issue_count,
             )
-            for review in items
+            for review, issue_count in items
         ]
         return PaginatedReviews(items=summaries, total=total)
 
@@ -84,8 +99,10 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
             review = service.get_review(review_id)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        # model_construct skips validation; the rows already passed the DB's
+        # typed columns on the way in.
         issues = [
-            IssuePayload(
+            IssuePayload.model_construct(
                 severity=issue.severity,
                 issue_type=issue.issue_type,
                 description=issue.description,
@@ -125,8 +142,16 @@ def get_session(request: Request) -> Iterator[Session]:
         yield session
 
 
+def get_github_client(request: Request) -> GitHubClient:
+    client = getattr(request.app.state, "github_client", None)
+    if client is None:  # pragma: no cover
+        raise RuntimeError("GitHub client not initialized")
+    return client
+
+
 def get_service(
     settings: Settings = Depends(get_settings),
     session: Session = Depends(get_session),
+    github_client: GitHubClient = Depends(get_github_client),
 ) -> ReviewService:
-    return ReviewService(settings=settings, session=session)
+    return ReviewService(settings=settings, session=session, github_client=github_client)
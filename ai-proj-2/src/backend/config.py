@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -34,7 +35,13 @@ class Settings:
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    """Read settings from the environment once per process.
+
+    Tests that need bespoke settings construct `Settings(...)` directly and
+    pass it to `create_app`, so they are unaffected by the memoization.
+    """
     settings = Settings()
     settings.ensure_directories()
     return settings
@@ -3,6 +3,9 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Iterator
 
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from .config import Settings
@@ -13,15 +16,36 @@ class Database:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        connect_args = {"check_same_thread": False} if "sqlite" in settings.database_url else {}
-        self.engine = create_engine(settings.database_url, echo=False, connect_args=connect_args)
+        is_sqlite = "sqlite" in settings.database_url
+        engine_kwargs: dict = {"echo": False}
+        if is_sqlite:
+            engine_kwargs["connect_args"] = {"check_same_thread": False}
+            if ":memory:" in settings.database_url:
+                engine_kwargs["poolclass"] = StaticPool
+        else:
+            engine_kwargs.update(pool_size=10, max_overflow=20, pool_pre_ping=True)
+        self.engine = create_engine(settings.database_url, **engine_kwargs)
+        # expire_on_commit=False keeps flushed attributes (ids, server-side
+        # timestamps) readable after commit without a re-SELECT.
+        self.session_factory = sessionmaker(self.engine, class_=Session, expire_on_commit=False)
+
+        if is_sqlite:
+            # WAL lets readers proceed while a review is being written;
+            # NORMAL sync and in-memory temp store cut per-commit fsync cost.
+            @event.listens_for(self.engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, _record):  # pragma: no cover
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
 
     def create_schema(self) -> None:
         SQLModel.metadata.create_all(self.engine)
 
     @contextmanager
     def session(self) -> Iterator[Session]:
-        session = Session(self.engine)
+        session = self.session_factory()
         try:
             yield session
         finally:
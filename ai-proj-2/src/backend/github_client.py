@@ -15,9 +15,11 @@ class GitHubClient:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self._client = httpx.Client(base_url=settings.github_api_url, timeout=10.0)
+        # Async + HTTP/2: concurrent fetches multiplex over one connection and
+        # the event loop stays free during the GitHub round-trip.
+        self._client = httpx.AsyncClient(base_url=settings.github_api_url, http2=True, timeout=10.0)
 
-    def fetch_file(self, repo: str, path: str, ref: Optional[str] = None) -> Optional[str]:
+    async def fetch_file(self, repo: str, path: str, ref: Optional[str] = None) -> Optional[str]:
         if not repo or not path:
             raise ValueError("Repository and path are required")
 
@@ -28,7 +30,7 @@ class GitHubClient:
         params = {"ref": ref} if ref else {}
         url = f"/repos/{repo}/contents/{path}"
         try:
-            response = self._client.get(url, headers=headers, params=params)
+            response = await self._client.get(url, headers=headers, params=params)
             if response.status_code == 200:
                 return response.text
             LOGGER.warning("GitHub fetch failed %s %s", response.status_code, response.text)
@@ -37,5 +39,5 @@ class GitHubClient:
             LOGGER.exception("GitHub request error: %s", exc)
             return None
 
-    def close(self) -> None:
-        self._client.close()
+    async def close(self) -> None:
+        await self._client.aclose()
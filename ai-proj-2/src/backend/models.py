@@ -1,16 +1,24 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Review(SQLModel, table=True):
+    # Serves both the filtered COUNT and the ordered listing in one index.
+    __table_args__ = (Index("ix_review_repo_created", "repository", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     repository: Optional[str] = Field(default=None)
     commit_sha: Optional[str] = Field(default=None)
     file_path: Optional[str] = Field(default=None)
     summary: str
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Timestamp generated by the database, keeping the column out of the
+    # INSERT statement and off the Python clock.
+    created_at: Optional[datetime] = Field(
+        default=None, nullable=False, sa_column_kwargs={"server_default": func.now()}
+    )
 
     issues: List["Issue"] = Relationship(back_populates="review")
 
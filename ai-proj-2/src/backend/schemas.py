@@ -3,7 +3,9 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+SEVERITY_RANKS = {"critical": 4, "high": 3, "medium": 2, "low": 1}
 
 
 class ReviewRequest(BaseModel):
@@ -22,6 +24,20 @@ class IssuePayload(BaseModel):
     line_start: Optional[int] = None
     line_end: Optional[int] = None
 
+    # Rank resolved once at construction so sorting reads an int attribute
+    # instead of calling severity_to_numeric per comparison.
+    _severity_rank: int = PrivateAttr(default=1)
+
+    @field_validator("description", "suggestion")
+    @classmethod
+    def _strip_text(cls, value: str) -> str:
+        # Normalizing here lets deduplication compare fields directly
+        # instead of re-stripping on every pass.
+        return value.strip()
+
+    def model_post_init(self, __context) -> None:
+        self._severity_rank = SEVERITY_RANKS.get(self.severity.lower(), 1)
+
 
 class ReviewResponse(BaseModel):
     id: int
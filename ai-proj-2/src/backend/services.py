@@ -1,34 +1,89 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import List, Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Tuple
 
-from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlmodel import Session, func, select
 
 from .config import Settings
 from .github_client import GitHubClient
 from .models import Issue, Review
-from .reviewers import ReviewPipeline
+from .reviewers import ReviewPipeline, ReviewResult
 from .schemas import IssuePayload, ReviewRequest, ReviewResponse
 
 LOGGER = logging.getLogger(__name__)
 
+# Content-addressed cache of pipeline results: identical (code, context,
+# model) payloads skip the heuristic + LLM stages entirely. In-process LRU;
+# swap for Redis if reviews are served from multiple nodes.
+_RESULT_CACHE: "OrderedDict[str, ReviewResult]" = OrderedDict()
+_RESULT_CACHE_LOCK = Lock()
+_RESULT_CACHE_MAX = 256
+
+
+# Hot listing statements built once at import; list_reviews only binds
+# parameters, skipping per-request Core expression construction.
+_LIST_REVIEWS_ALL = (
+    select(Review, func.count(Issue.id))
+    .join(Issue, isouter=True)
+    .group_by(Review.id)
+    .order_by(Review.created_at.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_LIST_REVIEWS_REPO = _LIST_REVIEWS_ALL.where(Review.repository == bindparam("repo"))
+
+
+def _cache_key(code: str, context: str, model_name: str) -> str:
+    digest = hashlib.sha256()
+    for part in (code, context, model_name):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _cache_get(key: str) -> Optional[ReviewResult]:
+    with _RESULT_CACHE_LOCK:
+        result = _RESULT_CACHE.get(key)
+        if result is not None:
+            _RESULT_CACHE.move_to_end(key)
+        return result
+
+
+def _cache_put(key: str, result: ReviewResult) -> None:
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = result
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
 
 class ReviewService:
     """Coordinates GitHub fetch, analysis, and persistence."""
 
-    def __init__(self, settings: Settings, session: Session):
+    def __init__(
+        self,
+        settings: Settings,
+        session: Session,
+        github_client: Optional[GitHubClient] = None,
+    ):
         self.settings = settings
         self.session = session
         self.pipeline = ReviewPipeline(settings)
-        self.github_client = GitHubClient(settings)
+        # Injected by the app so the pooled connection outlives the request;
+        # constructing one here is the fallback for direct/library use.
+        self.github_client = github_client or GitHubClient(settings)
 
-    def perform_review(self, payload: ReviewRequest) -> ReviewResponse:
+    async def perform_review(self, payload: ReviewRequest) -> ReviewResponse:
         code = payload.code or ""
         context_parts = []
         if payload.repository and payload.file_path:
             context_parts.append(f"Repository: {payload.repository}, file: {payload.file_path}")
-            fetched = self._fetch_from_github(payload.repository, payload.file_path, payload.commit_sha)
+            fetched = await self._fetch_from_github(payload.repository, payload.file_path, payload.commit_sha)
             if fetched:
                 code = fetched
             elif not code:
@@ -36,7 +91,12 @@ class ReviewService:
         if not code:
             raise ValueError("Code payload is empty.")
 
-        result = self.pipeline.review(code, " | ".join(context_parts))
+        context = " | ".join(context_parts)
+        cache_key = _cache_key(code, context, self.settings.model_name)
+        result = _cache_get(cache_key)
+        if result is None:
+            result = await self.pipeline.review(code, context)
+            _cache_put(cache_key, result)
         review = Review(
             repository=payload.repository,
             commit_sha=payload.commit_sha,
@@ -44,42 +104,50 @@ class ReviewService:
             summary=result.summary,
         )
         self.session.add(review)
-        self.session.flush()
-
-        issue_models: List[Issue] = []
-        for issue in result.issues:
-            issue_models.append(
-                Issue(
-                    review_id=review.id,
-                    severity=issue.severity,
-                    issue_type=issue.issue_type,
-                    description=issue.description,
-                    suggestion=issue.suggestion,
-                    line_start=issue.line_start,
-                    line_end=issue.line_end,
-                )
-            )
-        self.session.add_all(issue_models)
+        self.session.flush()  # assigns review.id for the issue rows
+
+        # Issues bypass ORM unit-of-work: one executemany INSERT of dicts.
+        self.session.bulk_insert_mappings(
+            Issue,
+            [
+                {
+                    "review_id": review.id,
+                    "severity": issue.severity,
+                    "issue_type": issue.issue_type,
+                    "description": issue.description,
+                    "suggestion": issue.suggestion,
+                    "line_start": issue.line_start,
+                    "line_end": issue.line_end,
+                }
+                for issue in result.issues
+            ],
+        )
         self.session.commit()
 
         return ReviewResponse(
             id=review.id,
             summary=review.summary,
-            issues=[IssuePayload(**issue.model_dump()) for issue in result.issues],
+            # result.issues are already IssuePayload instances; no need to
+            # dump and re-validate them.
+            issues=result.issues,
             created_at=review.created_at,
         )
 
-    def list_reviews(self, repo: Optional[str], limit: int, offset: int) -> List[Review]:
-        query = select(Review).order_by(Review.created_at.desc())
+    def list_reviews(self, repo: Optional[str], limit: int, offset: int) -> List[Tuple[Review, int]]:
+        # Outer-join the issue counts in the same query; len(review.issues)
+        # per row would lazy-load the Issue table once per review (N+1).
+        params = {"limit": limit, "offset": offset}
         if repo:
-            query = query.where(Review.repository == repo)
-        return self.session.exec(query.offset(offset).limit(limit)).all()
+            params["repo"] = repo
+            return self.session.exec(_LIST_REVIEWS_REPO, params=params).all()
+        return self.session.exec(_LIST_REVIEWS_ALL, params=params).all()
 
     def count_reviews(self, repo: Optional[str]) -> int:
-        query = select(Review)
+        # COUNT(*) in the database; fetching rows just to len() them is O(N).
+        query = select(func.count()).select_from(Review)
         if repo:
             query = query.where(Review.repository == repo)
-        return len(self.session.exec(query).all())
+        return self.session.exec(query).one()
 
     def get_review(self, review_id: int) -> Review:
         review = self.session.get(Review, review_id)
@@ -87,10 +155,10 @@ class ReviewService:
             raise ValueError(f"Review {review_id} not found")
         return review
 
-    def _fetch_from_github(self, repo: str, path: str, ref: Optional[str]) -> Optional[str]:
+    async def _fetch_from_github(self, repo: str, path: str, ref: Optional[str]) -> Optional[str]:
         if not repo or not path:
             return None
-        code = self.github_client.fetch_file(repo, path, ref)
+        code = await self.github_client.fetch_file(repo, path, ref)
         if code:
             LOGGER.info("Fetched code from GitHub repo=%s path=%s", repo, path)
         return code
@@ -3,24 +3,26 @@ from __future__ import annotations
 import logging
 from typing import Iterable, List
 
-from .schemas import IssuePayload
+from .schemas import SEVERITY_RANKS, IssuePayload
 
 LOGGER = logging.getLogger(__name__)
 
 
 def deduplicate_issues(issues: Iterable[IssuePayload]) -> List[IssuePayload]:
-    """Remove duplicate issues by (description, suggestion)."""
+    """Remove duplicate issues by (description, suggestion).
+
+    Fields are stripped once at IssuePayload construction, so the keys here
+    are direct attribute reads with no temporary strings.
+    """
     seen = set()
     unique: List[IssuePayload] = []
     for issue in issues:
-        key = (issue.description.strip(), issue.suggestion.strip())
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(issue)
+        key = (issue.description, issue.suggestion)
+        if key not in seen:
+            seen.add(key)
+            unique.append(issue)
     return unique
 
 
 def severity_to_numeric(severity: str) -> int:
-    mapping = {"critical": 4, "high": 3, "medium": 2, "low": 1}
-    return mapping.get(severity.lower(), 1)
+    return SEVERITY_RANKS.get(severity.lower(), 1)
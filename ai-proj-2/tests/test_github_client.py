@@ -18,11 +18,11 @@ class DummyClient:
         self.response = response
         self.requested = None
 
-    def get(self, url, headers=None, params=None):
+    async def get(self, url, headers=None, params=None):
         self.requested = (url, headers, params)
         return self.response
 
-    def close(self):
+    async def aclose(self):
         pass
 
 
@@ -31,17 +31,19 @@ def settings():
     return Settings(github_token="token", github_api_url="https://api.github.com")
 
 
-def test_fetch_file_success(monkeypatch, settings):
+@pytest.mark.asyncio
+async def test_fetch_file_success(monkeypatch, settings):
     client = GitHubClient(settings)
     dummy = DummyClient(DummyResponse(200, "print('hi')"))
     monkeypatch.setattr(client, "_client", dummy)
-    content = client.fetch_file("org/repo", "path.py", "refs/head")
+    content = await client.fetch_file("org/repo", "path.py", "refs/head")
     assert content == "print('hi')"
 
 
-def test_fetch_file_failure(monkeypatch, settings):
+@pytest.mark.asyncio
+async def test_fetch_file_failure(monkeypatch, settings):
     client = GitHubClient(settings)
     dummy = DummyClient(DummyResponse(404, "not found"))
     monkeypatch.setattr(client, "_client", dummy)
-    content = client.fetch_file("org/repo", "missing.py")
+    content = await client.fetch_file("org/repo", "missing.py")
     assert content is None
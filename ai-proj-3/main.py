@@ -22,7 +22,17 @@ def main() -> None:
 
     log_level = settings.log_level.lower()
     logging.getLogger("uvicorn.error").setLevel(log_level.upper())
-    uvicorn.run("main:app", host=settings.host, port=settings.port, log_level=log_level)
+    # uvloop + httptools cut event-loop and HTTP parsing overhead; WEB_CONCURRENCY
+    # scales worker processes for the CPU-bound embedding fallback.
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        log_level=log_level,
+        workers=settings.web_workers,
+        loop="uvloop",
+        http="httptools",
+    )
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry
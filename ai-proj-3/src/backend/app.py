@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import Settings, load_settings
 from .pipeline import RAGPipeline
-from .schemas import ChatRequest, ChatResponse, HistoryResponse, IngestRequest, SourceCitation
+from .schemas import ChatRequest, ChatResponse, IngestRequest, SourceCitation
 
 LOGGER = logging.getLogger(__name__)
 FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
@@ -26,6 +28,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         title=settings.app_name,
         version="1.0.0",
         description="Customer support RAG agent for telecom FAQs.",
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
@@ -44,6 +47,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     app.state.settings = settings
     app.state.pipeline = pipeline
 
+    @app.on_event("startup")
+    async def _warmup() -> None:
+        # First similarity search pays Chroma segment loading and index
+        # warmup; do it at boot so the first user request doesn't.
+        try:
+            await asyncio.to_thread(pipeline._vectorstore.similarity_search, "warmup", 1)
+        except Exception as exc:  # pragma: no cover - empty store is fine
+            LOGGER.debug("Warmup query skipped: %s", exc)
+
     @app.get("/health", tags=["system"])
     async def health() -> Dict[str, str]:
         return {"status": "ok", "environment": settings.environment}
@@ -65,7 +77,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     @app.post("/ingest", response_model=Dict[str, Any], tags=["ingestion"])
     async def ingest_documents(payload: IngestRequest, pipeline: RAGPipeline = Depends(_get_pipeline)) -> Dict[str, Any]:
         try:
-            metrics = pipeline.ingest(Path(payload.source_dir) if payload.source_dir else None)
+            metrics = await pipeline.aingest(Path(payload.source_dir) if payload.source_dir else None)
             return {"status": "completed", "metrics": metrics}
         except FileNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -75,31 +87,38 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     @app.post("/chat", response_model=ChatResponse, tags=["chat"])
     async def chat_endpoint(payload: ChatRequest, pipeline: RAGPipeline = Depends(_get_pipeline)) -> ChatResponse:
         try:
-            result = pipeline.query(payload.question)
+            result = await pipeline.aquery(payload.question)
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
         return ChatResponse(
             question=result["question"],
             answer=result["answer"],
-            sources=[SourceCitation(**src) for src in result["sources"]],
+            sources=_citation_payloads(result),
+        )
+
+    @app.post("/chat/stream", tags=["chat"])
+    async def chat_stream_endpoint(
+        payload: ChatRequest, pipeline: RAGPipeline = Depends(_get_pipeline)
+    ) -> StreamingResponse:
+        if not payload.question.strip():
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Question cannot be empty."
+            )
+        return StreamingResponse(
+            pipeline.aquery_stream(payload.question),
+            media_type="text/event-stream",
         )
 
-    @app.get("/history", response_model=HistoryResponse, tags=["chat"])
+    @app.get("/history", tags=["chat"])
     async def history(
         limit: int = Query(default=10, ge=1, le=settings.chat_history_limit),
         pipeline: RAGPipeline = Depends(_get_pipeline),
-    ) -> HistoryResponse:
-        items = pipeline.history(limit)
-        return HistoryResponse(
-            items=[
-                ChatResponse(
-                    question=entry["question"],
-                    answer=entry["answer"],
-                    sources=[SourceCitation(**src) for src in entry["sources"]],
-                )
-                for entry in items
-            ]
-        )
+    ) -> Response:
+        # Entries carry their JSON bytes from query() time; the response is
+        # spliced together without touching Pydantic or a JSON encoder.
+        fragments = [entry["_json"] for entry in pipeline.history(limit)]
+        body = b'{"items":[' + b",".join(fragments) + b"]}"
+        return Response(content=body, media_type="application/json")
 
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
@@ -112,6 +131,19 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     return app
 
 
+def _citation_payloads(entry: Dict[str, Any]) -> List[SourceCitation]:
+    """Convert a result's citations to response models, memoizing on the entry.
+
+    History entries are immutable once appended, so /history replays reuse the
+    first conversion instead of reformatting every citation per GET.
+    """
+    cached = entry.get("_citation_models")
+    if cached is None:
+        cached = [SourceCitation.model_construct(**asdict(c)) for c in entry["sources"]]
+        entry["_citation_models"] = cached
+    return cached
+
+
 def _get_pipeline(request: Request) -> RAGPipeline:
     pipeline = getattr(request.app.state, "pipeline", None)
     if pipeline is None:  # pragma: no cover - defensive path
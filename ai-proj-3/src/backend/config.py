@@ -14,6 +14,7 @@ class Settings:
     environment: str = field(default_factory=lambda: os.getenv("ENVIRONMENT", "local"))
     host: str = field(default_factory=lambda: os.getenv("HOST", "0.0.0.0"))
     port: int = field(default_factory=lambda: int(os.getenv("PORT", "8000")))
+    web_workers: int = field(default_factory=lambda: int(os.getenv("WEB_CONCURRENCY", "1")))
     openai_api_key: Optional[str] = field(default_factory=lambda: os.getenv("OPENAI_API_KEY"))
     gemini_api_key: Optional[str] = field(default_factory=lambda: os.getenv("GEMINI_API_KEY"))
     model_provider: str = field(default_factory=lambda: os.getenv("MODEL_PROVIDER", "openai"))
@@ -26,12 +27,16 @@ class Settings:
     chunk_size: int = field(default_factory=lambda: int(os.getenv("CHUNK_SIZE", "800")))
     chunk_overlap: int = field(default_factory=lambda: int(os.getenv("CHUNK_OVERLAP", "150")))
     top_k: int = field(default_factory=lambda: int(os.getenv("TOP_K", "4")))
+    max_concurrent_embeddings: int = field(
+        default_factory=lambda: int(os.getenv("OPENAI_MAX_CONCURRENT", "16"))
+    )
     chat_history_limit: int = field(default_factory=lambda: int(os.getenv("CHAT_HISTORY_LIMIT", "50")))
     frontend_origin: str = field(default_factory=lambda: os.getenv("FRONTEND_ORIGIN", "*"))
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
     enable_fake_embeddings: bool = field(default_factory=lambda: os.getenv("USE_FAKE_EMBEDDINGS", "0") == "1")
     enable_fake_llm: bool = field(default_factory=lambda: os.getenv("USE_FAKE_LLM", "0") == "1")
     chroma_collection: str = field(default_factory=lambda: os.getenv("CHROMA_COLLECTION", "telecom_support_docs"))
+    vector_backend: str = field(default_factory=lambda: os.getenv("VECTOR_BACKEND", "chroma"))
 
     def ensure_directories(self) -> None:
         """Ensure directories referenced in settings exist."""
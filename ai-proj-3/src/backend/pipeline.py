@@ -1,48 +1,188 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import itertools
+import json
 import logging
 import threading
-from collections import deque
-from dataclasses import dataclass
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Deque, Dict, List, Optional
+from typing import AsyncIterator, Deque, Dict, List, Optional
 
+import numpy as np
+import orjson
 from langchain.schema import Document
 from langchain.embeddings.base import Embeddings
 
 try:
+    import chromadb
     from langchain_community.vectorstores import Chroma
 except ImportError as exc:  # pragma: no cover - library should be installed via requirements
     raise RuntimeError("Chroma dependencies are missing; install `chromadb`.") from exc
 
 from .config import Settings
 from .utils import format_sources, load_and_split_documents
+from .vectorstore import FaissVectorStore
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional fast hash
+    blake3 = None  # type: ignore
+
+# Provider SDKs are imported at module load so the cost lands at server boot,
+# not on the first request.
+try:
+    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+except ImportError:  # pragma: no cover - optional provider
+    ChatOpenAI = OpenAIEmbeddings = None  # type: ignore
+
+try:
+    from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+except ImportError:  # pragma: no cover - optional provider
+    ChatGoogleGenerativeAI = GoogleGenerativeAIEmbeddings = None  # type: ignore
 
 LOGGER = logging.getLogger(__name__)
 
+# Dynamic batching window for concurrent chat requests: coalesce up to
+# _CHAT_BATCH_MAX questions arriving within _CHAT_BATCH_WAIT_MS into one
+# embedding call and one batched LLM call.
+_CHAT_BATCH_MAX = 16
+_CHAT_BATCH_WAIT_MS = 10
+
+
+def _sse_event(payload: Dict[str, object]) -> str:
+    """Serialize a payload as a single Server-Sent Events data frame."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.maximum(norms, np.finfo(matrix.dtype).tiny, out=norms)
+    return matrix / norms
+
+
+class _NormalizedEmbeddings(Embeddings):
+    """Adapter that L2-normalizes vectors from the wrapped provider.
+
+    With unit vectors, inner product equals cosine similarity, so the store
+    can use the cheaper ip space and skip per-query norm computation.
+    """
+
+    def __init__(self, inner: Embeddings):
+        self._inner = inner
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        matrix = np.asarray(self._inner.embed_documents(texts), dtype=np.float32)
+        return _normalize_rows(matrix).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = np.asarray(self._inner.embed_query(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return (vector / norm if norm else vector).tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        matrix = np.asarray(await self._inner.aembed_documents(texts), dtype=np.float32)
+        return _normalize_rows(matrix).tolist()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        vector = np.asarray(await self._inner.aembed_query(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return (vector / norm if norm else vector).tolist()
+
 
 @dataclass
 class HashEmbeddingFunction(Embeddings):
-    """Deterministic embedding fallback using SHA-based hashing."""
+    """Deterministic embedding fallback using keyed hashing (BLAKE3 or SHA)."""
 
     dimension: int = 384
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        return [self._vectorize(text) for text in texts]
+        return self._vectorize_batch(texts).tolist()
 
     def embed_query(self, text: str) -> List[float]:
         return self._vectorize(text)
 
     def _vectorize(self, text: str) -> List[float]:
+        row = self._fill_row(text).astype(np.float16) * np.float16(1 / 255)
+        norm = float(np.linalg.norm(row))
+        return (row / np.float16(norm) if norm else row).tolist()
+
+    def _vectorize_batch(self, texts: List[str]) -> np.ndarray:
+        """Vectorize a batch into one contiguous (N, dimension) half-float array.
+
+        The digests land in a single pre-allocated uint8 buffer, are scaled in
+        one vectorized pass, and L2-normalized row-wise; float16 halves the
+        bytes moved through the scaling and normalization kernels.
+        """
+        out = np.empty((len(texts), self.dimension), dtype=np.uint8)
+        for row, text in enumerate(texts):
+            out[row] = self._fill_row(text)
+        return _normalize_rows(out.astype(np.float16) * np.float16(1 / 255))
+
+    def _fill_row(self, text: str) -> np.ndarray:
         seed = text.strip() or "empty"
-        vector: List[float] = []
-        counter = 0
-        while len(vector) < self.dimension:
-            digest = hashlib.sha256(f"{seed}-{counter}".encode("utf-8")).digest()
-            vector.extend([byte / 255 for byte in digest])
-            counter += 1
-        return vector[: self.dimension]
+        if blake3 is not None:
+            # BLAKE3 is an XOF: one SIMD-accelerated call emits all
+            # `dimension` bytes, with no counter loop or block stitching.
+            digest = blake3.blake3(seed.encode("utf-8")).digest(length=self.dimension)
+            return np.frombuffer(digest, dtype=np.uint8)
+        n_blocks = -(-self.dimension // 32)  # sha256 digest is 32 bytes
+        buf = np.empty(n_blocks * 32, dtype=np.uint8)
+        for i in range(n_blocks):
+            digest = hashlib.sha256(f"{seed}-{i}".encode("utf-8")).digest()
+            buf[i * 32 : (i + 1) * 32] = np.frombuffer(digest, dtype=np.uint8)
+        return buf[: self.dimension]
+
+
+class _SemanticQueryCache:
+    """Answer cache keyed by L2-normalized query embeddings.
+
+    A flat inner-product search over a few hundred cached vectors is a single
+    matrix-vector product, so near-duplicate questions return in well under a
+    millisecond instead of re-running retrieval and generation. Entries are
+    stored in a fixed-size ring; overwriting the oldest slot doubles as
+    eviction, and stale entries are skipped via TTL.
+    """
+
+    def __init__(self, max_entries: int = 256, threshold: float = 0.92, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._results: List[Dict[str, object]] = []
+        self._stamps: List[float] = []
+        self._pos = 0
+
+    def get(self, unit_vector: np.ndarray) -> Optional[Dict[str, object]]:
+        with self._lock:
+            if not self._results:
+                return None
+            scores = self._vectors[: len(self._results)] @ unit_vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            if time.monotonic() - self._stamps[best] > self.ttl_seconds:
+                return None
+            return self._results[best]
+
+    def put(self, unit_vector: np.ndarray, result: Dict[str, object]) -> None:
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty((self.max_entries, unit_vector.shape[0]), dtype=np.float32)
+            if len(self._results) < self.max_entries:
+                self._vectors[len(self._results)] = unit_vector
+                self._results.append(result)
+                self._stamps.append(time.monotonic())
+            else:
+                self._vectors[self._pos] = unit_vector
+                self._results[self._pos] = result
+                self._stamps[self._pos] = time.monotonic()
+                self._pos = (self._pos + 1) % self.max_entries
 
 
 class RAGPipeline:
@@ -55,42 +195,72 @@ class RAGPipeline:
         self._embedding = self._build_embedding()
         self._vectorstore = self._build_vectorstore()
         self._llm = self._build_llm()
+        self._qcache = _SemanticQueryCache()
+        # Exact-string layer in front of the semantic cache: a repeat of the
+        # very same question never touches the embedding provider.
+        self._exact_cache: "OrderedDict[str, Dict[str, object]]" = OrderedDict()
+        self._exact_cache_max = 256
+        # Lazily started per-event-loop batching queue for aquery.
+        self._batch_queue: Optional["asyncio.Queue"] = None
+        self._batch_worker: Optional["asyncio.Task"] = None
 
     # ---------------------------
     # Builders
     # ---------------------------
     def _build_embedding(self) -> Embeddings:
         if not self.settings.enable_fake_embeddings and self.settings.openai_api_key:
-            try:
-                from langchain_openai import OpenAIEmbeddings
-            except ImportError:
+            if OpenAIEmbeddings is None:
                 LOGGER.warning("langchain-openai not installed; falling back to hash embeddings.")
             else:
                 LOGGER.info("Using OpenAI embeddings with model %s", self.settings.model_name)
-                return OpenAIEmbeddings(model=self.settings.model_name, api_key=self.settings.openai_api_key)
+                return _NormalizedEmbeddings(
+                    OpenAIEmbeddings(model=self.settings.model_name, api_key=self.settings.openai_api_key)
+                )
 
         if not self.settings.enable_fake_embeddings and self.settings.gemini_api_key:
-            try:
-                from langchain_google_genai import GoogleGenerativeAIEmbeddings
-            except ImportError:
+            if GoogleGenerativeAIEmbeddings is None:
                 LOGGER.warning("langchain-google-genai not installed; using hash embeddings.")
             else:
                 LOGGER.info("Using Gemini embeddings with model %s", self.settings.gemini_model_name)
-                return GoogleGenerativeAIEmbeddings(
-                    model=self.settings.gemini_model_name,
-                    google_api_key=self.settings.gemini_api_key,
+                return _NormalizedEmbeddings(
+                    GoogleGenerativeAIEmbeddings(
+                        model=self.settings.gemini_model_name,
+                        google_api_key=self.settings.gemini_api_key,
+                    )
                 )
 
         LOGGER.info("Using deterministic hash embeddings.")
         return HashEmbeddingFunction()
 
-    def _build_vectorstore(self) -> Chroma:
+    def _build_vectorstore(self) -> "Chroma | FaissVectorStore":
         persist_dir = str(self.settings.vector_store_path)
+        if self.settings.vector_backend.lower() == "faiss":
+            LOGGER.info("Initializing FAISS vector store at %s", persist_dir)
+            return FaissVectorStore(self.settings, self._embedding)
         LOGGER.info("Initializing Chroma vector store at %s", persist_dir)
+        # One PersistentClient for the process: its SQLite connections (and
+        # the page cache behind them) stay hot across requests instead of
+        # being re-established through Chroma's per-instance client setup.
+        client = chromadb.PersistentClient(
+            path=persist_dir,
+            settings=chromadb.Settings(anonymized_telemetry=False),
+        )
         return Chroma(
+            client=client,
             collection_name=self.settings.chroma_collection,
             embedding_function=self._embedding,
             persist_directory=persist_dir,
+            # HNSW tuning: larger M/construction_ef spend index build time to
+            # flatten query latency; search_ef=64 keeps recall high at top_k=4
+            # while bounding the per-query candidate scan.
+            collection_metadata={
+                "hnsw:M": 32,
+                "hnsw:construction_ef": 200,
+                "hnsw:search_ef": 64,
+                # Vectors are L2-normalized at embed time, so inner product
+                # equals cosine without the per-comparison norm divide.
+                "hnsw:space": "ip",
+            },
         )
 
     def _build_llm(self):
@@ -99,9 +269,7 @@ class RAGPipeline:
             return None
 
         if self.settings.openai_api_key and self.settings.model_provider.lower() == "openai":
-            try:
-                from langchain_openai import ChatOpenAI
-            except ImportError:
+            if ChatOpenAI is None:
                 LOGGER.warning("langchain-openai not installed; defaulting to heuristic responses.")
             else:
                 LOGGER.info("Using OpenAI Chat model %s", self.settings.model_name)
@@ -112,9 +280,7 @@ class RAGPipeline:
                 )
 
         if self.settings.gemini_api_key:
-            try:
-                from langchain_google_genai import ChatGoogleGenerativeAI
-            except ImportError:
+            if ChatGoogleGenerativeAI is None:
                 LOGGER.warning("langchain-google-genai not installed; defaulting to heuristic responses.")
             else:
                 LOGGER.info("Using Gemini Chat model %s", self.settings.gemini_model_name)
@@ -131,24 +297,83 @@ class RAGPipeline:
     # Pipeline methods
     # ---------------------------
     def ingest(self, source_dir: Optional[Path] = None) -> Dict[str, int]:
-        """Ingest documents from the provided directory."""
+        """Ingest documents from the provided directory (sync entry point)."""
+        return asyncio.run(self.aingest(source_dir))
+
+    async def aingest(self, source_dir: Optional[Path] = None) -> Dict[str, int]:
+        """Ingest documents, overlapping the network-bound embedding batches."""
         directory = Path(source_dir or self.settings.docs_path)
         LOGGER.info("Starting ingestion from %s", directory)
-        documents, metrics = load_and_split_documents(
+        documents, metrics = await asyncio.to_thread(
+            load_and_split_documents,
             directory=directory,
             chunk_size=self.settings.chunk_size,
             chunk_overlap=self.settings.chunk_overlap,
         )
         LOGGER.info("Loaded %s chunks from %s files", metrics["chunks"], metrics["files"])
-        with self._lock:
-            self._vectorstore.add_documents(documents)
+        embeddings = await self._aembed_in_batches(documents)
+
+        def _write() -> None:
+            with self._lock:
+                self._vectorstore._collection.upsert(
+                    ids=[str(uuid.uuid4()) for _ in documents],
+                    embeddings=embeddings,
+                    documents=[doc.page_content for doc in documents],
+                    metadatas=[doc.metadata for doc in documents],
+                )
+            # One persist per ingest, outside the lock: queries are not
+            # blocked while segment files are rewritten.
             self._vectorstore.persist()
 
+        # The store write is a blocking C call; keep it off the event loop so
+        # concurrent chat requests are not stalled behind an ingest.
+        await asyncio.to_thread(_write)
+
         collection = getattr(self._vectorstore, "_collection", None)
         if collection is not None:  # pragma: no branch - attribute exists in Chroma
             metrics["collection_size"] = collection.count()
         return metrics
 
+    @staticmethod
+    def _length_sorted_batches(documents: List[Document], batch_size: int) -> List[List[int]]:
+        """Slice document indices into mini-batches sorted by content length.
+
+        Sorting by content length keeps each provider batch uniformly sized
+        (less padding waste), and batching amortizes the per-request overhead
+        that dominates when chunks are embedded one at a time.
+        """
+        order = sorted(
+            range(len(documents)),
+            key=lambda i: len(documents[i].page_content),
+            reverse=True,
+        )
+        return [order[start : start + batch_size] for start in range(0, len(order), batch_size)]
+
+    def _embed_in_batches(self, documents: List[Document], batch_size: int = 64) -> List[List[float]]:
+        """Embed chunks in length-sorted mini-batches, preserving input order."""
+        embeddings: List[Optional[List[float]]] = [None] * len(documents)
+        for batch in self._length_sorted_batches(documents, batch_size):
+            vectors = self._embedding.embed_documents([documents[i].page_content for i in batch])
+            for idx, vector in zip(batch, vectors):
+                embeddings[idx] = vector
+        return embeddings  # type: ignore[return-value]
+
+    async def _aembed_in_batches(self, documents: List[Document], batch_size: int = 64) -> List[List[float]]:
+        """Embed mini-batches concurrently, overlapping provider round trips."""
+        embeddings: List[Optional[List[float]]] = [None] * len(documents)
+        semaphore = asyncio.Semaphore(self.settings.max_concurrent_embeddings)
+
+        async def _run(batch: List[int]) -> None:
+            async with semaphore:
+                vectors = await self._embedding.aembed_documents(
+                    [documents[i].page_content for i in batch]
+                )
+            for idx, vector in zip(batch, vectors):
+                embeddings[idx] = vector
+
+        await asyncio.gather(*(_run(batch) for batch in self._length_sorted_batches(documents, batch_size)))
+        return embeddings  # type: ignore[return-value]
+
     def query(self, question: str) -> Dict[str, object]:
         """Answer a question using retrieval + (optional) generative response."""
         clean_question = question.strip()
@@ -156,7 +381,23 @@ class RAGPipeline:
             raise ValueError("Question cannot be empty.")
 
         LOGGER.debug("Received question: %s", clean_question)
-        docs = self._vectorstore.similarity_search(clean_question, k=self.settings.top_k)
+        exact = self._exact_lookup(clean_question)
+        if exact is not None:
+            self._history.appendleft(exact)
+            return exact
+
+        # Embed once: the vector serves both the semantic cache probe and, on
+        # a miss, the vector store search.
+        query_vector = np.asarray(self._embedding.embed_query(clean_question), dtype=np.float32)
+        norm = float(np.linalg.norm(query_vector))
+        unit_vector = query_vector / norm if norm else query_vector
+        cached = self._qcache.get(unit_vector)
+        if cached is not None:
+            LOGGER.debug("Semantic cache hit for question: %s", clean_question)
+            self._history.appendleft(cached)
+            return cached
+
+        docs = self._vectorstore.similarity_search_by_vector(query_vector.tolist(), k=self.settings.top_k)
         if not docs:
             LOGGER.warning("No documents matched the question.")
             return {
@@ -166,45 +407,232 @@ class RAGPipeline:
             }
 
         answer = self._generate_answer(clean_question, docs)
-        sources = format_sources(docs)
-        result = {"question": clean_question, "answer": answer, "sources": sources}
+        return self._store_result(clean_question, unit_vector, docs, answer)
+
+    def _exact_lookup(self, clean_question: str) -> Optional[Dict[str, object]]:
         with self._lock:
-            self._history.appendleft(result)
+            exact = self._exact_cache.get(clean_question)
+            if exact is not None:
+                self._exact_cache.move_to_end(clean_question)
+            return exact
+
+    @staticmethod
+    def _attach_json(result: Dict[str, object]) -> Dict[str, object]:
+        # History entries are immutable once appended; serializing here moves
+        # JSON encoding off the (hot) /history read path onto the write path.
+        result["_json"] = orjson.dumps(result)
         return result
 
+    def _store_result(
+        self,
+        clean_question: str,
+        unit_vector: np.ndarray,
+        docs: List[Document],
+        answer: str,
+    ) -> Dict[str, object]:
+        result = self._attach_json(
+            {"question": clean_question, "answer": answer, "sources": format_sources(docs)}
+        )
+        self._qcache.put(unit_vector, result)
+        with self._lock:
+            self._exact_cache[clean_question] = result
+            while len(self._exact_cache) > self._exact_cache_max:
+                self._exact_cache.popitem(last=False)
+        # deque.appendleft is atomic under the GIL; no lock needed.
+        self._history.appendleft(result)
+        return result
+
+    async def aquery(self, question: str) -> Dict[str, object]:
+        """Answer a question via the dynamic-batching queue.
+
+        Concurrent callers landing within the batching window share one
+        embedding request and one batched LLM call, amortizing provider
+        round trips across requests.
+        """
+        clean_question = question.strip()
+        if not clean_question:
+            raise ValueError("Question cannot be empty.")
+        exact = self._exact_lookup(clean_question)
+        if exact is not None:
+            self._history.appendleft(exact)
+            return exact
+
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = asyncio.get_running_loop().create_task(self._batch_loop())
+        future: "asyncio.Future[Dict[str, object]]" = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((clean_question, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + _CHAT_BATCH_WAIT_MS / 1000
+            while len(batch) < _CHAT_BATCH_MAX:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                results = await self._process_batch([question for question, _ in batch])
+            except Exception as exc:  # pragma: no cover - defensive path
+                LOGGER.exception("Chat batch failed: %s", exc)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _process_batch(self, questions: List[str]) -> List[Dict[str, object]]:
+        # One provider call embeds every question in the window.
+        vectors = await asyncio.to_thread(self._embedding.embed_documents, questions)
+        results: List[Optional[Dict[str, object]]] = [None] * len(questions)
+        units: List[np.ndarray] = []
+        for idx, vector in enumerate(vectors):
+            array = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(array))
+            unit = array / norm if norm else array
+            units.append(unit)
+            cached = self._qcache.get(unit)
+            if cached is not None:
+                results[idx] = cached
+                self._history.appendleft(cached)
+
+        misses = [idx for idx in range(len(questions)) if results[idx] is None]
+        docs_per_miss = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._vectorstore.similarity_search_by_vector, vectors[idx], self.settings.top_k
+                )
+                for idx in misses
+            )
+        )
+
+        need_llm: List[int] = []
+        llm_docs: List[List[Document]] = []
+        for idx, docs in zip(misses, docs_per_miss):
+            if not docs:
+                results[idx] = {
+                    "question": questions[idx],
+                    "answer": "I could not find relevant information in the knowledge base yet.",
+                    "sources": [],
+                }
+            elif self._llm is not None:
+                need_llm.append(idx)
+                llm_docs.append(docs)
+            else:
+                results[idx] = self._store_result(
+                    questions[idx], units[idx], docs, self._fallback_answer(docs)
+                )
+
+        if need_llm:
+            prompts = [
+                self._build_prompt(questions[idx], docs) for idx, docs in zip(need_llm, llm_docs)
+            ]
+            try:
+                responses = await self._llm.abatch(prompts)  # type: ignore[attr-defined]
+            except Exception as exc:  # pragma: no cover - defensive path
+                LOGGER.exception("Batched LLM call failed: %s", exc)
+                responses = [None] * len(prompts)
+            for idx, docs, response in zip(need_llm, llm_docs, responses):
+                if response is None:
+                    answer = self._fallback_answer(docs)
+                else:
+                    answer = (getattr(response, "content", None) or str(response)).strip()
+                results[idx] = self._store_result(questions[idx], units[idx], docs, answer)
+
+        return results  # type: ignore[return-value]
+
     def history(self, limit: Optional[int] = None) -> List[Dict[str, object]]:
         """Return recent chat history."""
         lim = limit or self.settings.chat_history_limit
-        return list(list(self._history)[0:lim])
+        # islice walks only the first `lim` entries instead of copying the
+        # whole deque twice.
+        return list(itertools.islice(self._history, lim))
 
-    def _generate_answer(self, question: str, documents: List[Document]) -> str:
+    async def aquery_stream(self, question: str) -> AsyncIterator[str]:
+        """Answer a question as a stream of SSE events.
+
+        Retrieval runs first; tokens are then forwarded as the LLM produces
+        them, so clients see output at time-to-first-token rather than after
+        the whole answer is generated. The final event carries the citations.
+        """
+        clean_question = question.strip()
+        if not clean_question:
+            raise ValueError("Question cannot be empty.")
+
+        docs = await asyncio.to_thread(
+            self._vectorstore.similarity_search, clean_question, self.settings.top_k
+        )
+        if not docs:
+            answer = "I could not find relevant information in the knowledge base yet."
+            yield _sse_event({"token": answer})
+            yield _sse_event({"done": True, "sources": []})
+            return
+
+        sources = [asdict(citation) for citation in format_sources(docs)]
+        parts: List[str] = []
+        if self._llm is not None:
+            prompt = self._build_prompt(clean_question, docs)
+            try:
+                async for chunk in self._llm.astream(prompt):  # type: ignore[attr-defined]
+                    text = getattr(chunk, "content", None) or ""
+                    if text:
+                        parts.append(text)
+                        yield _sse_event({"token": text})
+            except Exception as exc:  # pragma: no cover - defensive path
+                LOGGER.exception("LLM streaming failed: %s", exc)
+        if not parts:
+            answer = self._fallback_answer(docs)
+            parts.append(answer)
+            yield _sse_event({"token": answer})
+        yield _sse_event({"done": True, "sources": sources})
+
+        result = self._attach_json(
+            {"question": clean_question, "answer": "".join(parts), "sources": sources}
+        )
+        self._history.appendleft(result)
+
+    def _build_prompt(self, question: str, documents: List[Document]) -> str:
         context = "\n\n".join(
-            f"[Source {idx+1}] {doc.page_content.strip()}" for idx, doc in enumerate(documents)
+            f"[Source {idx+1}] {doc.metadata.get('stripped') or doc.page_content.strip()}"
+            for idx, doc in enumerate(documents)
+        )
+        return (
+            "You are a telecom customer support policy assistant. Use the context to craft a concise answer.\n"
+            "If the answer is not present, politely say you do not know.\n"
+            f"Question: {question}\n"
+            f"Context:\n{context}\n"
+            "Answer with 2-3 sentences and cite sources as [Source #]."
         )
+
+    def _generate_answer(self, question: str, documents: List[Document]) -> str:
         if self._llm:
-            prompt = (
-                "You are a telecom customer support policy assistant. Use the context to craft a concise answer.\n"
-                "If the answer is not present, politely say you do not know.\n"
-                f"Question: {question}\n"
-                f"Context:\n{context}\n"
-                "Answer with 2-3 sentences and cite sources as [Source #]."
-            )
             try:
-                response = self._llm.invoke(prompt)  # type: ignore[call-arg]
+                response = self._llm.invoke(self._build_prompt(question, documents))  # type: ignore[call-arg]
                 if hasattr(response, "content"):
                     return response.content.strip()
                 return str(response).strip()
             except Exception as exc:  # pragma: no cover - defensive path
                 LOGGER.exception("LLM invocation failed: %s", exc)
 
+        return self._fallback_answer(documents)
+
+    @staticmethod
+    def _fallback_answer(documents: List[Document]) -> str:
         # Deterministic fallback summarizer
         snippets = []
         for idx, doc in enumerate(documents, start=1):
-            text = doc.page_content.replace("\n", " ")
-            snippets.append(f"[Source {idx}] {text[:220]}...")
-        fallback_answer = (
+            text = doc.metadata.get("snippet220") or doc.page_content.strip()[:220]
+            snippets.append(f"[Source {idx}] {text}...")
+        return (
             "Based on the knowledge base, here is what I found: "
             + " ".join(snippets)
             + " If this does not answer the question, consider adding more detailed documents."
         )
-        return fallback_answer
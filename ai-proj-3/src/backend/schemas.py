@@ -39,6 +39,10 @@ class ChatResponse(BaseModel):
 
 
 class HistoryResponse(BaseModel):
-    """List of previous messages for UI replay."""
+    """List of previous messages for UI replay.
+
+    Kept as the documented shape of GET /history, which now serves
+    pre-serialized bytes instead of building this model per request.
+    """
 
     items: List[ChatResponse]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from langchain.schema import Document
+from langchain.embeddings.base import Embeddings
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - optional backend
+    faiss = None  # type: ignore
+
+from .config import Settings
+
+LOGGER = logging.getLogger(__name__)
+
+# Below this many vectors, IVF-PQ cannot be trained meaningfully (the PQ
+# codebooks need at least 256 samples per subquantizer); use exact search.
+_MIN_TRAIN_VECTORS = 1024
+_PQ_SUBQUANTIZERS = 48
+
+
+class FaissVectorStore:
+    """FAISS-backed store exposing the surface the pipeline uses from Chroma.
+
+    Large collections get an IVF-PQ index (coarse quantizer + 8-bit product
+    codes), shrinking the store by an order of magnitude and bounding each
+    query to a few probed cells instead of a linear scan. Small collections
+    fall back to an exact flat inner-product index, where IVF-PQ would only
+    cost recall.
+    """
+
+    def __init__(self, settings: Settings, embedding: Embeddings):
+        if faiss is None:
+            raise RuntimeError("FAISS backend selected but `faiss-cpu` is not installed.")
+        self.settings = settings
+        self._embedding = embedding
+        self._lock = threading.Lock()
+        self._index: Optional["faiss.Index"] = None
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, object]] = []
+        store_dir = Path(settings.vector_store_path)
+        self._index_path = store_dir / "faiss.index"
+        self._docs_path = store_dir / "faiss_docs.json"
+        self._load()
+        # The pipeline reaches for `_collection.upsert`/`.count()` (the Chroma
+        # collection surface); this store answers those calls itself.
+        self._collection = self
+
+    # ---------------------------
+    # Chroma-collection surface
+    # ---------------------------
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, object]],
+    ) -> None:
+        # FAISS has no per-id replacement; ids are accepted for interface
+        # parity but writes are append-only.
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        with self._lock:
+            if self._index is None:
+                self._index = self._build_index(vectors)
+            if not self._index.is_trained:  # pragma: no cover - large-corpus path
+                self._index.train(vectors)
+            self._index.add(vectors)
+            self._documents.extend(documents)
+            self._metadatas.extend(metadatas)
+
+    def count(self) -> int:
+        return int(self._index.ntotal) if self._index is not None else 0
+
+    # ---------------------------
+    # Vector store surface
+    # ---------------------------
+    def similarity_search(self, query: str, k: int = 4) -> List[Document]:
+        return self.similarity_search_by_vector(self._embedding.embed_query(query), k=k)
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4) -> List[Document]:
+        if self._index is None or self._index.ntotal == 0:
+            return []
+        vector = np.asarray(embedding, dtype=np.float32)[None, :]
+        _, indices = self._index.search(vector, k)
+        return [
+            Document(page_content=self._documents[idx], metadata=self._metadatas[idx])
+            for idx in indices[0]
+            if idx >= 0
+        ]
+
+    def persist(self) -> None:
+        if self._index is None:
+            return
+        self._index_path.parent.mkdir(parents=True, exist_ok=True)
+        faiss.write_index(self._index, str(self._index_path))
+        payload = {"documents": self._documents, "metadatas": self._metadatas}
+        self._docs_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    # ---------------------------
+    # Internals
+    # ---------------------------
+    def _build_index(self, vectors: np.ndarray) -> "faiss.Index":
+        count, dim = vectors.shape
+        if count >= _MIN_TRAIN_VECTORS and dim % _PQ_SUBQUANTIZERS == 0:  # pragma: no cover
+            nlist = max(1, min(1024, int(math.sqrt(count))))
+            index = faiss.index_factory(
+                dim, f"IVF{nlist},PQ{_PQ_SUBQUANTIZERS}", faiss.METRIC_INNER_PRODUCT
+            )
+            index.nprobe = 8
+            LOGGER.info("Building IVF-PQ index (nlist=%s) for %s vectors", nlist, count)
+            return index
+        LOGGER.info("Corpus too small for IVF-PQ; using exact flat IP index.")
+        return faiss.IndexFlatIP(dim)
+
+    def _load(self) -> None:
+        if not (self._index_path.exists() and self._docs_path.exists()):
+            return
+        self._index = faiss.read_index(str(self._index_path))
+        payload = json.loads(self._docs_path.read_text(encoding="utf-8"))
+        self._documents = payload["documents"]
+        self._metadatas = payload["metadatas"]
+        LOGGER.info("Loaded FAISS index with %s vectors", self._index.ntotal)
@@ -1,21 +1,79 @@
 from __future__ import annotations
 
+import io
 import logging
+from datetime import datetime
 from typing import Iterator, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlmodel import Session
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlmodel import Session, select
 
 from .config import Settings, load_settings
 from .db import Database
+from .models import Issue, ValidationReport
 from .schemas import DatasetRequest, HealthResponse, PaginatedReports, ValidationResponse
 from .services import ValidationService
+from .validators import load_csv
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _json_response(response: ValidationResponse) -> Response:
+    """Serialize straight to JSON bytes with pydantic's Rust core.
+
+    Returning the model would run it through jsonable_encoder and then
+    json.dumps — two passes over the nested issue list.
+    """
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+def _stream_report(database: Database, report_id: int) -> Iterator[bytes]:
+    """Stream a report as JSON without materializing its issue list.
+
+    The object head is emitted first, then issues are serialized one row at
+    a time as the cursor iterates, so peak memory stays flat and the client
+    sees first bytes before the last issue row is read. Opens its own
+    session because the request-scoped one closes when the handler returns.
+    """
+    with database.session() as session:
+        report = session.exec(
+            select(ValidationReport).where(ValidationReport.id == report_id)
+        ).one()
+        head = orjson.dumps(
+            {
+                "report_id": report.id,
+                "dataset_name": report.dataset_name,
+                "total_rows": report.total_rows,
+                "missing_rate": report.missing_rate,
+                "duplicate_count": report.duplicate_count,
+                "outlier_rate": report.outlier_rate,
+                "summary": report.summary,
+                "created_at": report.created_at,
+            }
+        )
+        yield head[:-1] + b',"issues":['
+        first = True
+        issue_rows = session.exec(
+            select(Issue).where(Issue.report_id == report_id).execution_options(yield_per=500)
+        )
+        for issue in issue_rows:
+            chunk = orjson.dumps(
+                {
+                    "issue_type": issue.issue_type,
+                    "severity": issue.severity,
+                    "description": issue.description,
+                    "recommendation": issue.recommendation,
+                    "affected_columns": issue.affected_columns.split(",") if issue.affected_columns else [],
+                }
+            )
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]}"
+
+
 def create_app(settings: Optional[Settings] = None) -> FastAPI:
     settings = settings or load_settings()
     database = Database(settings)
@@ -41,29 +99,63 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
     async def validate_dataset(
         payload: DatasetRequest,
         service: ValidationService = Depends(get_service),
-    ) -> ValidationResponse:
+    ) -> Response:
         try:
-            return service.validate_dataset(payload)
+            return _json_response(service.validate_dataset(payload))
         except FileNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
+    @app.post("/validate/csv", response_model=ValidationResponse, tags=["validation"])
+    async def validate_csv(
+        request: Request,
+        dataset_name: str = Query(default="uploaded_csv"),
+        service: ValidationService = Depends(get_service),
+    ) -> Response:
+        """Validate raw CSV bytes in one server-side parse.
+
+        Clients post the file body as-is instead of parsing it locally and
+        re-encoding rows as JSON records.
+        """
+        body = await request.body()
+        if not body:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty CSV body.")
+        try:
+            df = load_csv(io.BytesIO(body))
+        except Exception as exc:  # parser error types differ by engine
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not parse CSV: {exc}"
+            ) from exc
+        return _json_response(service.validate_frame(df, dataset_name))
+
     @app.get("/reports", response_model=PaginatedReports, tags=["validation"])
     async def list_reports(
         dataset_name: Optional[str] = Query(default=None),
         limit: int = Query(default=10, ge=1, le=100),
-        offset: int = Query(default=0, ge=0),
+        before: Optional[datetime] = Query(
+            default=None, description="Keyset cursor: created_at of the last item seen"
+        ),
+        before_id: Optional[int] = Query(
+            default=None, description="Keyset cursor tiebreaker: id of the last item seen"
+        ),
         service: ValidationService = Depends(get_service),
     ) -> PaginatedReports:
-        return service.list_reports(dataset_name, limit, offset)
+        return service.list_reports(dataset_name, limit, before, before_id)
 
     @app.get("/reports/{report_id}", response_model=ValidationResponse, tags=["validation"])
-    async def get_report(report_id: int, service: ValidationService = Depends(get_service)) -> ValidationResponse:
-        try:
-            return service.get_report(report_id)
-        except ValueError as exc:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    async def get_report(
+        report_id: int,
+        request: Request,
+        service: ValidationService = Depends(get_service),
+    ) -> Response:
+        if not service.report_exists(report_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Report {report_id} not found"
+            )
+        return StreamingResponse(
+            _stream_report(get_database(request), report_id), media_type="application/json"
+        )
 
     @app.exception_handler(Exception)
     async def handle_exception(_: Request, exc: Exception):
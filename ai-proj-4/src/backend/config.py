@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+
+def _key_columns_from_env() -> Optional[List[str]]:
+    raw = os.getenv("DUPLICATE_KEY_COLUMNS", "")
+    columns = [col.strip() for col in raw.split(",") if col.strip()]
+    return columns or None
 
 
 @dataclass
@@ -27,12 +34,20 @@ class Settings:
     missing_threshold: float = field(default_factory=lambda: float(os.getenv("MISSING_THRESHOLD", "0.05")))
     outlier_zscore: float = field(default_factory=lambda: float(os.getenv("OUTLIER_ZSCORE", "3.0")))
     duplicate_tolerance: int = field(default_factory=lambda: int(os.getenv("DUPLICATE_TOLERANCE", "0")))
+    duplicate_key_columns: Optional[List[str]] = field(default_factory=_key_columns_from_env)
 
     def ensure_directories(self) -> None:
         self.data_root.mkdir(parents=True, exist_ok=True)
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    """Load settings once per process.
+
+    Every env read and the mkdir happen on the first call only; later calls
+    (per-request dependencies included) return the same instance. Tests that
+    need different values construct Settings directly.
+    """
     settings = Settings()
     settings.ensure_directories()
     return settings
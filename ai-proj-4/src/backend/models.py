@@ -1,10 +1,15 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class ValidationReport(SQLModel, table=True):
+    # Covers the list_reports filter + sort so the count path can use an
+    # index-only scan.
+    __table_args__ = (Index("ix_report_dataset_created", "dataset_name", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     dataset_name: str
     total_rows: int
@@ -19,7 +24,7 @@ class ValidationReport(SQLModel, table=True):
 
 class Issue(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    report_id: int = Field(foreign_key="validationreport.id")
+    report_id: int = Field(foreign_key="validationreport.id", index=True)
     issue_type: str
     severity: str
     description: str
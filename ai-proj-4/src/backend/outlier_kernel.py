@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional JIT accelerator
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+
+
+if njit is not None:
+
+    @njit(cache=True, inline="always")
+    def _quantile_sorted(values, q):  # pragma: no cover - exercised via kernel
+        """Linear-interpolated quantile of a sorted 1-D array (NumPy default)."""
+        n = values.size
+        if n == 1:
+            return values[0]
+        pos = q * (n - 1)
+        low = int(pos)
+        high = low + 1 if low + 1 < n else low
+        frac = pos - low
+        return values[low] * (1.0 - frac) + values[high] * frac
+
+    # fastmath minus the nnan/ninf flags: full fastmath lets LLVM assume no
+    # NaNs exist and folds the isnan guards away, corrupting the per-column
+    # statistics on frames with missing values.
+    @njit(cache=True, parallel=True, fastmath={"contract", "reassoc", "arcp", "nsz"})
+    def outlier_mask(arr, z_thresh):  # pragma: no cover - exercised via analyze
+        """Fused single-kernel outlier detection over a (rows, cols) array.
+
+        Each column is traversed once for its moments, once (sorted copy) for
+        the IQR fences, and once for the combined z/IQR mask — all inside one
+        compiled kernel parallelized across columns, instead of several
+        full-array NumPy passes.
+        """
+        rows, cols = arr.shape
+        mask = np.zeros((rows, cols), dtype=np.bool_)
+        for col_idx in prange(cols):
+            count = 0
+            total = 0.0
+            total_sq = 0.0
+            for row_idx in range(rows):
+                value = arr[row_idx, col_idx]
+                if not np.isnan(value):
+                    count += 1
+                    total += value
+                    total_sq += value * value
+            if count == 0:
+                continue
+            mean = total / count
+            variance = total_sq / count - mean * mean
+            std = np.sqrt(variance) if variance > 0 else 1.0
+
+            finite = np.empty(count, dtype=arr.dtype)
+            pos = 0
+            for row_idx in range(rows):
+                value = arr[row_idx, col_idx]
+                if not np.isnan(value):
+                    finite[pos] = value
+                    pos += 1
+            finite.sort()
+            q1 = _quantile_sorted(finite, 0.25)
+            q3 = _quantile_sorted(finite, 0.75)
+            iqr = q3 - q1
+            lower = q1 - 1.5 * iqr
+            upper = q3 + 1.5 * iqr
+
+            z_limit = z_thresh * std
+            for row_idx in range(rows):
+                value = arr[row_idx, col_idx]
+                if not np.isnan(value) and (
+                    abs(value - mean) > z_limit or value < lower or value > upper
+                ):
+                    mask[row_idx, col_idx] = True
+        return mask
+
+else:  # pragma: no cover - numba not installed
+    outlier_mask = None
@@ -3,17 +3,37 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class DatasetRequest(BaseModel):
     dataset_name: Optional[str] = Field(default=None, description="Human readable dataset name")
     data_path: Optional[str] = Field(default=None, description="Relative path to dataset on server")
     records: Optional[List[Dict[str, object]]] = Field(default=None, description="Inline dataset as list of records")
+    columns: Optional[Dict[str, List[object]]] = Field(
+        default=None,
+        description=(
+            "Inline dataset as column-name -> values mapping. Preferred over "
+            "records for large payloads: pandas builds each column with a "
+            "single dtype inference instead of scanning every row of dicts."
+        ),
+    )
     fmt: str = Field(default="csv", description="Dataset format: csv or json")
 
+    @model_validator(mode="after")
+    def _check_column_lengths(self) -> "DatasetRequest":
+        if self.columns:
+            lengths = {len(values) for values in self.columns.values()}
+            if len(lengths) > 1:
+                raise ValueError("All columns must have the same number of values.")
+        return self
+
 
 class IssuePayload(BaseModel):
+    # Issues are created once and never mutated; frozen instances hash and
+    # copy cheaply and make the trusted model_construct path safe to share.
+    model_config = ConfigDict(frozen=True)
+
     issue_type: str
     severity: str
     description: str
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import Optional
 
 import pandas as pd
-from sqlmodel import Session, select
+from sqlalchemy import and_, or_
+from sqlmodel import Session, func, select
 
 from .config import Settings
 from .models import Issue, ValidationReport
-from .schemas import DatasetRequest, IssuePayload, PaginatedReports, ReportSummary, ValidationResponse
+from .schemas import DatasetRequest, PaginatedReports, ReportSummary, ValidationResponse
 from .summarizer import ReportSummarizer
 from .validators import DataValidator, ValidationResult
-from .utils import serialize_issue
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +28,9 @@ class ValidationService:
 
     def validate_dataset(self, payload: DatasetRequest) -> ValidationResponse:
         df, dataset_name = self._load_dataset(payload)
+        return self.validate_frame(df, dataset_name)
+
+    def validate_frame(self, df: pd.DataFrame, dataset_name: str) -> ValidationResponse:
         result = self.validator.validate(df, dataset_name)
         summary_text = self.summarizer.summarize(
             dataset_name=result.dataset_name,
@@ -45,42 +49,67 @@ class ValidationService:
         self.session.add(report)
         self.session.flush()
 
-        issue_models: List[Issue] = []
-        for issue in result.issues:
-            issue_models.append(
-                Issue(
-                    report_id=report.id,
-                    issue_type=issue.issue_type,
-                    severity=issue.severity,
-                    description=issue.description,
-                    recommendation=issue.recommendation,
-                    affected_columns=",".join(issue.affected_columns or []),
-                )
-            )
-        self.session.add_all(issue_models)
+        if result.issues:
+            # Core bulk insert: one multi-VALUES statement, no ORM identity-map
+            # bookkeeping or per-row INSERT round-trips.
+            rows = [
+                {
+                    "report_id": report.id,
+                    "issue_type": issue.issue_type,
+                    "severity": issue.severity,
+                    "description": issue.description,
+                    "recommendation": issue.recommendation,
+                    "affected_columns": ",".join(issue.affected_columns or []),
+                }
+                for issue in result.issues
+            ]
+            self.session.connection().execute(Issue.__table__.insert(), rows)
         self.session.commit()
 
-        return ValidationResponse(
+        # Internally produced values; model_construct skips re-validation.
+        return ValidationResponse.model_construct(
             report_id=report.id,
             dataset_name=report.dataset_name,
             total_rows=report.total_rows,
             missing_rate=report.missing_rate,
             duplicate_count=report.duplicate_count,
             outlier_rate=report.outlier_rate,
-            issues=[IssuePayload(**serialize_issue(issue)) for issue in result.issues],
+            issues=list(result.issues),
             summary=report.summary,
             created_at=report.created_at,
         )
 
-    def list_reports(self, dataset_name: Optional[str], limit: int, offset: int) -> PaginatedReports:
-        query = select(ValidationReport).order_by(ValidationReport.created_at.desc())
+    def list_reports(
+        self,
+        dataset_name: Optional[str],
+        limit: int,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+    ) -> PaginatedReports:
+        # Keyset pagination on (created_at, id): the database seeks straight
+        # to the cursor via the composite index instead of scanning and
+        # discarding OFFSET rows. Clients pass the last item of the previous
+        # page as the cursor.
+        query = select(ValidationReport).order_by(
+            ValidationReport.created_at.desc(), ValidationReport.id.desc()
+        )
         if dataset_name:
             query = query.where(ValidationReport.dataset_name == dataset_name)
-        items = self.session.exec(query.offset(offset).limit(limit)).all()
-        total_query = select(ValidationReport)
+        if before is not None:
+            cursor = ValidationReport.created_at < before
+            if before_id is not None:
+                cursor = or_(
+                    cursor,
+                    and_(ValidationReport.created_at == before, ValidationReport.id < before_id),
+                )
+            query = query.where(cursor)
+        items = self.session.exec(query.limit(limit)).all()
+        # COUNT(*) in the database; hydrating every report just to len() it
+        # is O(N) in both ORM construction and I/O.
+        count_stmt = select(func.count(ValidationReport.id))
         if dataset_name:
-            total_query = total_query.where(ValidationReport.dataset_name == dataset_name)
-        total = len(self.session.exec(total_query).all())
+            count_stmt = count_stmt.where(ValidationReport.dataset_name == dataset_name)
+        total = self.session.exec(count_stmt).one()
         summaries = [
             ReportSummary(
                 id=item.id,
@@ -94,32 +123,11 @@ class ValidationService:
         ]
         return PaginatedReports(items=summaries, total=total)
 
-    def get_report(self, report_id: int) -> ValidationResponse:
-        report = self.session.get(ValidationReport, report_id)
-        if not report:
-            raise ValueError(f"Report {report_id} not found")
-        issues = self.session.exec(select(Issue).where(Issue.report_id == report_id)).all()
-        payloads = [
-            IssuePayload(
-                issue_type=issue.issue_type,
-                severity=issue.severity,
-                description=issue.description,
-                recommendation=issue.recommendation,
-                affected_columns=issue.affected_columns.split(",") if issue.affected_columns else [],
-            )
-            for issue in issues
-        ]
-        return ValidationResponse(
-            report_id=report.id,
-            dataset_name=report.dataset_name,
-            total_rows=report.total_rows,
-            missing_rate=report.missing_rate,
-            duplicate_count=report.duplicate_count,
-            outlier_rate=report.outlier_rate,
-            issues=payloads,
-            summary=report.summary,
-            created_at=report.created_at,
-        )
+    def report_exists(self, report_id: int) -> bool:
+        found = self.session.exec(
+            select(ValidationReport.id).where(ValidationReport.id == report_id)
+        ).one_or_none()
+        return found is not None
 
     def _load_dataset(self, payload: DatasetRequest) -> tuple[pd.DataFrame, str]:
         from .validators import load_dataset
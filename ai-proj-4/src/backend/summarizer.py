@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import List
 
 from .config import Settings
@@ -8,10 +9,33 @@ from .schemas import IssuePayload
 
 LOGGER = logging.getLogger(__name__)
 
-try:
+
+@lru_cache(maxsize=4)
+def _get_chain(model_name: str, api_key: str):
+    """Build the prompt | llm chain on first real use, once per model/key.
+
+    The langchain imports live here rather than at module scope: they
+    dominate cold-start time and with USE_FAKE_LLM=1 they are never paid.
+    Summarizers are built per request; caching the chain keeps the compiled
+    template, httpx connection pool, and tokenizer state warm across calls.
+    """
+    from langchain_core.prompts import ChatPromptTemplate
     from langchain_openai import ChatOpenAI
-except ImportError:  # pragma: no cover
-    ChatOpenAI = None  # type: ignore
+
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                "You are a data quality analyst. Summarize the validation results using concise language. "
+                "Include key metrics (missing rate, duplicates, outliers) and highlight top remediation steps.",
+            ),
+            (
+                "human",
+                "Dataset: {dataset}\nMissing Rate: {missing}\nOutlier Rate: {outlier}\nIssues: {issues}",
+            ),
+        ]
+    )
+    return prompt | ChatOpenAI(model=model_name, temperature=0, api_key=api_key)
 
 
 class ReportSummarizer:
@@ -19,23 +43,25 @@ class ReportSummarizer:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.llm = None
-        if not settings.use_fake_llm and settings.openai_api_key and ChatOpenAI:
-            self.llm = ChatOpenAI(model=settings.model_name, temperature=0, api_key=settings.openai_api_key)
+        self._chain = None
+        if not settings.use_fake_llm and settings.openai_api_key:
+            try:
+                self._chain = _get_chain(settings.model_name, settings.openai_api_key)
+            except ImportError:  # pragma: no cover
+                LOGGER.warning("langchain-openai not installed; using fallback summaries.")
 
     def summarize(self, dataset_name: str, issues: List[IssuePayload], missing_rate: float, outlier_rate: float) -> str:
-        if self.llm is None:
+        if self._chain is None:
             return self._fallback_summary(dataset_name, issues, missing_rate, outlier_rate)
-        prompt = (
-            "You are a data quality analyst. Summarize the validation results using concise language. "
-            "Include key metrics (missing rate, duplicates, outliers) and highlight top remediation steps."
-        )
-        detail = (
-            f"Dataset: {dataset_name}\nMissing Rate: {missing_rate:.2%}\n"
-            f"Outlier Rate: {outlier_rate:.2%}\nIssues: {', '.join(issue.issue_type for issue in issues) or 'None'}"
-        )
         try:
-            response = self.llm.invoke(prompt + "\n\n" + detail)
+            response = self._chain.invoke(
+                {
+                    "dataset": dataset_name,
+                    "missing": f"{missing_rate:.2%}",
+                    "outlier": f"{outlier_rate:.2%}",
+                    "issues": ", ".join(issue.issue_type for issue in issues) or "None",
+                }
+            )
             if hasattr(response, "content"):
                 return response.content.strip()
         except Exception as exc:  # pragma: no cover
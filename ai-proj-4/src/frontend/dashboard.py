@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import httpx
-import pandas as pd
 import streamlit as st
 
 API_BASE = "http://localhost:8200"
@@ -16,8 +15,9 @@ response.raise_for_status()
 reports = response.json()
 
 if reports["items"]:
-    df = pd.DataFrame(reports["items"])
-    st.dataframe(df)
+    # st.dataframe accepts the list of dicts directly; going through a
+    # pandas constructor first just adds type inference and a copy per render.
+    st.dataframe(reports["items"])
 else:
     st.info("No reports yet. Submit a dataset via the API.")
 
@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import io
-import json
 import os
 from pathlib import Path
 
 import httpx
-import pandas as pd
 import streamlit as st
 
 API_BASE = os.getenv("API_BASE", "http://localhost:8200")
@@ -27,12 +24,17 @@ with code_col2:
 
 if st.button("Validate Dataset", type="primary"):
     if uploaded is not None:
-        records = uploaded.read().decode("utf-8")
-        df = pd.read_csv(io.StringIO(records))
-        payload = {"dataset_name": dataset_name, "records": json.loads(df.to_json(orient="records"))}
+        # Ship the raw bytes; the server parses the CSV once instead of the
+        # old parse -> to_json -> json.loads round trip on the client.
+        response = client.post(
+            f"{API_BASE}/validate/csv",
+            params={"dataset_name": dataset_name},
+            content=uploaded.read(),
+            headers={"Content-Type": "text/csv"},
+        )
     else:
         payload = {"dataset_name": dataset_name, "data_path": data_path, "fmt": "csv"}
-    response = client.post(f"{API_BASE}/validate", json=payload)
+        response = client.post(f"{API_BASE}/validate", json=payload)
     if response.status_code == 200:
         data = response.json()
         st.success(data["summary"])
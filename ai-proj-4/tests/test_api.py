@@ -25,6 +25,58 @@ def test_validate_inline(client):
     assert data["dataset_name"] == "inline"
 
 
+def test_validate_columnar(client):
+    payload = {
+        "dataset_name": "columnar",
+        "columns": {"a": [1, None, 100], "b": [2, 3, 2]},
+    }
+    response = client.post("/validate", json=payload)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["dataset_name"] == "columnar"
+    assert data["total_rows"] == 3
+
+
+def test_validate_ragged_columns_rejected(client):
+    payload = {"dataset_name": "bad", "columns": {"a": [1, 2], "b": [3]}}
+    response = client.post("/validate", json=payload)
+    assert response.status_code == 422
+
+
+def test_validate_csv_upload(client):
+    body = b"a,b\n1,2\n,3\n100,2\n"
+    response = client.post(
+        "/validate/csv",
+        params={"dataset_name": "upload"},
+        content=body,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["dataset_name"] == "upload"
+    assert data["total_rows"] == 3
+
+
 def test_validate_missing_payload(client):
     response = client.post("/validate", json={"dataset_name": "bad"})
     assert response.status_code == 400
+
+
+def test_get_report_streams_full_document(client):
+    payload = {
+        "dataset_name": "detail",
+        "records": [{"a": 1, "b": 2}, {"a": None, "b": 3}, {"a": 100, "b": 2}],
+    }
+    report_id = client.post("/validate", json=payload).json()["report_id"]
+    response = client.get(f"/reports/{report_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["report_id"] == report_id
+    assert data["dataset_name"] == "detail"
+    assert data["issues"]
+    assert {"issue_type", "severity", "affected_columns"} <= set(data["issues"][0])
+
+
+def test_get_report_missing(client):
+    response = client.get("/reports/999999")
+    assert response.status_code == 404
@@ -43,8 +43,15 @@ class PlannerAgent:
 @dataclass
 class ResearcherAgent:
     settings: Settings
+    _client: httpx.AsyncClient | None = None
 
-    def search(self, query: str) -> List[dict]:
+    def _get_client(self) -> httpx.AsyncClient:
+        # Lazy so the fake-search path never opens a connection pool.
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=15.0)
+        return self._client
+
+    async def search(self, query: str) -> List[dict]:
         if self.settings.use_fake_search or not self.settings.serpapi_api_key:
             LOGGER.info("Researcher using cached results for query '%s'", query)
             return []
@@ -55,7 +62,7 @@ class ResearcherAgent:
             "api_key": self.settings.serpapi_api_key,
         }
         try:
-            response = httpx.get("https://serpapi.com/search", params=params, timeout=15.0)
+            response = await self._get_client().get("https://serpapi.com/search", params=params)
             response.raise_for_status()
             organic = response.json().get("organic_results", [])
             return [
@@ -102,3 +109,33 @@ class SummarizerAgent:
         response = chain.invoke({"topic": topic, "evidence": json.dumps(evidence)})
         content = response.content if hasattr(response, "content") else str(response)
         return {"summary": content, "insights": []}
+
+    def summarize_batch(self, items: List[tuple]) -> List[dict]:
+        """Summarize several (topic, evidence) pairs in one LLM batch call.
+
+        chain.batch amortizes connection and scheduling overhead across the
+        whole batch instead of paying it per topic.
+        """
+        if self.settings.use_fake_llm or ChatOpenAI is None:
+            return [self.summarize(topic, evidence) for topic, evidence in items]
+
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    "You are an analyst generating concise research summaries with bullet insights and source references.",
+                ),
+                (
+                    "human",
+                    "Topic: {topic}. Evidence: {evidence}. Produce Markdown summary and JSON insights list",
+                ),
+            ]
+        )
+        chain = prompt | ChatOpenAI(model=self.settings.model_name, temperature=0.3, api_key=self.settings.openai_api_key)
+        responses = chain.batch(
+            [{"topic": topic, "evidence": json.dumps(evidence)} for topic, evidence in items]
+        )
+        return [
+            {"summary": r.content if hasattr(r, "content") else str(r), "insights": []}
+            for r in responses
+        ]
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Iterator
+from datetime import datetime
+from typing import AsyncIterator
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+import httpx
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlmodel import Session
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import Settings, load_settings
 from .db import Database
-from .schemas import HealthResponse, PaginatedReports, ResearchRequest, ResearchResponse, ReportSummary
-from .services import ResearchService
+from .schemas import (
+    BatchRequest,
+    BatchResponse,
+    BatchResponseItem,
+    HealthResponse,
+    PaginatedReports,
+    ReportSummary,
+    ResearchRequest,
+    ResearchResponse,
+    TaskStatus,
+    TaskSubmission,
+)
+from .orchestrator import ResearchOrchestrator
+from .services import ReportNotFound, ResearchService
+from .tasks import TaskRegistry
 
 LOGGER = logging.getLogger(__name__)
 
@@ -19,9 +35,12 @@ LOGGER = logging.getLogger(__name__)
 def create_app(settings: Settings | None = None) -> FastAPI:
     settings = settings or load_settings()
     database = Database(settings)
-    database.create_schema()
 
-    app = FastAPI(title=settings.app_name, version="1.0.0")
+    app = FastAPI(title=settings.app_name, version="1.0.0", default_response_class=ORJSONResponse)
+
+    @app.on_event("startup")
+    async def _create_schema() -> None:
+        await database.create_schema()
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -31,35 +50,110 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     )
     app.state.settings = settings
     app.state.database = database
+    app.state.tasks = TaskRegistry()
+    # Built once per app: orchestrator init loads the search cache from disk
+    # and constructs all three agents, none of which belongs on the request path.
+    app.state.orchestrator = ResearchOrchestrator(settings)
 
     @app.get("/health", response_model=HealthResponse, tags=["system"])
     async def health() -> HealthResponse:
         return HealthResponse(status="ok", environment=settings.environment)
 
     @app.post("/research", response_model=ResearchResponse, tags=["research"])
-    async def run_research(payload: ResearchRequest, service: ResearchService = Depends(get_service)) -> ResearchResponse:
-        try:
-            return service.run_research(payload)
-        except ValueError as exc:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    async def run_research(
+        payload: ResearchRequest,
+        background_tasks: BackgroundTasks,
+        service: ResearchService = Depends(get_service),
+    ) -> ResearchResponse:
+        return await service.run_research(payload, background=background_tasks)
+
+    @app.post(
+        "/research/async",
+        response_model=TaskSubmission,
+        status_code=status.HTTP_202_ACCEPTED,
+        tags=["research"],
+    )
+    async def run_research_async(payload: ResearchRequest) -> TaskSubmission:
+        """Queue the pipeline off the request path and return a task id.
+
+        The job opens its own session because the request-scoped one closes
+        as soon as this handler returns.
+        """
+
+        async def _job() -> dict:
+            async with database.session() as session:
+                service = ResearchService(
+                    settings=settings, session=session, orchestrator=app.state.orchestrator
+                )
+                response = await service.run_research(payload)
+                return response.model_dump()
+
+        return TaskSubmission(task_id=app.state.tasks.submit(_job()))
+
+    @app.get("/research/{task_id}", response_model=TaskStatus, tags=["research"])
+    async def research_status(task_id: str) -> TaskStatus:
+        record = app.state.tasks.get(task_id)
+        if record is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found"
+            )
+        return TaskStatus(**record)
 
     @app.get("/reports", response_model=PaginatedReports, tags=["research"])
     async def list_reports(
         limit: int = Query(default=10, ge=1, le=100),
-        offset: int = Query(default=0, ge=0),
+        before: datetime | None = Query(
+            default=None, description="Keyset cursor: created_at of the last item seen"
+        ),
         service: ResearchService = Depends(get_service),
     ) -> PaginatedReports:
-        reports = service.list_reports(limit=limit, offset=offset)
-        total = service.count_reports()
+        reports = await service.list_reports(limit=limit, before=before)
+        total = await service.count_reports()
         items = [ReportSummary(id=report.id, topic=report.topic, created_at=report.created_at) for report in reports]
-        return PaginatedReports(items=items, total=total)
+        next_cursor = items[-1].created_at if len(items) == limit else None
+        return PaginatedReports(items=items, total=total, next_cursor=next_cursor)
 
     @app.get("/reports/{report_id}", response_model=ResearchResponse, tags=["research"])
     async def get_report(report_id: int, service: ResearchService = Depends(get_service)) -> ResearchResponse:
-        try:
-            return service.get_report(report_id)
-        except ValueError as exc:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        return await service.get_report(report_id)
+
+    @app.post("/batch", response_model=BatchResponse, tags=["system"])
+    async def batch(payload: BatchRequest) -> BatchResponse:
+        """Execute independent member requests concurrently in one round-trip.
+
+        Members are dispatched back through the app over an in-process ASGI
+        transport and gathered, so clients pay one network RTT instead of
+        one per request. Members must not depend on each other's effects.
+        """
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://batch") as client:
+
+            async def _dispatch(item) -> BatchResponseItem:
+                if item.url.lstrip("/").startswith("batch"):
+                    return BatchResponseItem(
+                        id=item.id, status=status.HTTP_400_BAD_REQUEST,
+                        body={"detail": "Nested batch requests are not allowed"},
+                    )
+                response = await client.request(item.method.upper(), item.url, json=item.body)
+                try:
+                    body = response.json()
+                except ValueError:  # pragma: no cover - non-JSON member response
+                    body = None
+                return BatchResponseItem(id=item.id, status=response.status_code, body=body)
+
+            responses = await asyncio.gather(*(_dispatch(item) for item in payload.requests))
+        return BatchResponse(responses=list(responses))
+
+    # Service errors surface as ValueError subclasses; translating them
+    # here once keeps the route handlers to a single service call instead
+    # of a try/except + HTTPException per endpoint.
+    @app.exception_handler(ReportNotFound)
+    async def report_not_found_handler(_: Request, exc: ReportNotFound) -> ORJSONResponse:
+        return ORJSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)})
+
+    @app.exception_handler(ValueError)
+    async def value_error_handler(_: Request, exc: ValueError) -> ORJSONResponse:
+        return ORJSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
 
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(_: Request, exc: Exception):  # pragma: no cover
@@ -83,11 +177,25 @@ def get_database(request: Request) -> Database:
     return database
 
 
-def get_session(request: Request) -> Iterator[Session]:
+async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
     database = get_database(request)
-    with database.session() as session:
+    async with database.session() as session:
         yield session
 
 
-def get_service(settings: Settings = Depends(get_settings), session: Session = Depends(get_session)) -> ResearchService:
-    return ResearchService(settings=settings, session=session)
+def get_orchestrator(request: Request) -> ResearchOrchestrator:
+    orchestrator = getattr(request.app.state, "orchestrator", None)
+    if orchestrator is None:  # pragma: no cover
+        raise RuntimeError("Orchestrator not initialised")
+    return orchestrator
+
+
+def get_service(
+    settings: Settings = Depends(get_settings),
+    session: AsyncSession = Depends(get_session),
+    orchestrator: ResearchOrchestrator = Depends(get_orchestrator),
+    database: Database = Depends(get_database),
+) -> ResearchService:
+    return ResearchService(
+        settings=settings, session=session, orchestrator=orchestrator, database=database
+    )
@@ -1,27 +1,74 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Iterator
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import Settings
 
+# Applied once per new pooled connection: WAL lets readers overlap the
+# writer, and the larger page cache (-20000 = ~20MB) keeps repeat queries
+# in RAM for the connection's lifetime.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _async_url(database_url: str) -> str:
+    """Map a plain sqlite:// URL onto the aiosqlite driver."""
+    if database_url.startswith("sqlite://") and "+aiosqlite" not in database_url:
+        return database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return database_url
+
 
 class Database:
-    """Manages SQLModel engine and sessions."""
+    """Manages the async SQLModel engine and sessions.
+
+    Synchronous sessions blocked the uvicorn event loop for every query;
+    with aiosqlite the DB waits yield to the loop so concurrent requests
+    overlap instead of queueing behind each other's I/O.
+    """
 
     def __init__(self, settings: Settings):
-        connect_args = {"check_same_thread": False} if "sqlite" in settings.database_url else {}
-        self.engine = create_engine(settings.database_url, echo=False, connect_args=connect_args)
+        url = _async_url(settings.database_url)
+        # SQLAlchemy defaults SQLite to NullPool, so every request paid a
+        # fresh connection open and a cold page cache. A real queue pool
+        # keeps long-lived connections (and their caches) warm.
+        self.engine = create_async_engine(
+            url,
+            echo=False,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
+        if url.startswith("sqlite"):
+
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _tune_sqlite(dbapi_connection, _record) -> None:
+                cursor = dbapi_connection.cursor()
+                for pragma in _SQLITE_PRAGMAS:
+                    cursor.execute(pragma)
+                cursor.close()
+
+        self._session_factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
 
-    def create_schema(self) -> None:
-        SQLModel.metadata.create_all(self.engine)
+    async def create_schema(self) -> None:
+        async with self.engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
 
-    @contextmanager
-    def session(self) -> Iterator[Session]:
-        session = Session(self.engine)
-        try:
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        async with self._session_factory() as session:
             yield session
-        finally:
-            session.close()
@@ -6,10 +6,14 @@ from sqlmodel import Field, Relationship, SQLModel
 
 class ResearchReport(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    topic: str
+    # Unique so repeated /research posts dedupe to one row per topic via
+    # INSERT ... ON CONFLICT DO NOTHING.
+    topic: str = Field(index=True, unique=True)
     summary_md: str
     insights_json: str
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    # Indexed so the list_reports ORDER BY created_at DESC is an index range
+    # scan rather than a filesort.
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False, index=True)
 
     sources: List["Source"] = Relationship(back_populates="report")
 
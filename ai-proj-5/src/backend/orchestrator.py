@@ -1,15 +1,76 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Hashable, List, Optional
+
+import orjson
 
 from .agents import PlannerAgent, ResearcherAgent, SummarizerAgent
 from .config import Settings
 
 LOGGER = logging.getLogger(__name__)
 
+# Cap on concurrent external search calls per orchestrator.
+_MAX_SEARCH_CONCURRENCY = 8
+
+_AGENT_CACHE_MAX = 1024
+_AGENT_CACHE_TTL = 3600.0
+
+# Concurrent summarize calls arriving within this window are coalesced
+# into one batched LLM call.
+_SUMMARY_BATCH_MAX = 16
+_SUMMARY_BATCH_WAIT = 0.05
+
+
+class _TTLCache:
+    """Small LRU+TTL cache for deterministic agent outputs.
+
+    Popular topics hit the planner and summarizer repeatedly with
+    identical inputs; serving them from memory skips the LLM call (or the
+    fake-path string work) entirely.
+    """
+
+    def __init__(self, max_entries: int = _AGENT_CACHE_MAX, ttl: float = _AGENT_CACHE_TTL):
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+
+    def get(self, key: Hashable) -> Optional[object]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=8)
+def _parse_cache_file(path: str, mtime_ns: int) -> Dict[str, List[Dict[str, str]]]:
+    """Parse the search-cache JSON, memoized on (path, mtime).
+
+    orjson decodes the bytes several times faster than stdlib json, and the
+    mtime key makes reloads of an unchanged file free while still picking
+    up edits.
+    """
+    data = orjson.loads(Path(path).read_bytes())
+    return {entry["query"].lower(): entry.get("results", []) for entry in data.get("queries", [])}
+
 
 class ResearchOrchestrator:
     """Coordinates planner, researcher, and summarizer agents."""
@@ -20,32 +81,52 @@ class ResearchOrchestrator:
         self.researcher = ResearcherAgent(settings)
         self.summarizer = SummarizerAgent(settings)
         self.cached_data = self._load_cache(settings.data_cache_path)
+        # The cache is immutable after load, so the general fallback (first
+        # entry) can be picked once instead of per miss.
+        self._fallback_results = next(iter(self.cached_data.values()), [])
+        self._search_semaphore = asyncio.Semaphore(_MAX_SEARCH_CONCURRENCY)
+        self._plan_cache = _TTLCache()
+        self._summary_cache = _TTLCache()
+        self._summary_queue: Optional[asyncio.Queue] = None
+        self._summary_worker: Optional[asyncio.Task] = None
 
     def _load_cache(self, path: Path) -> Dict[str, List[Dict[str, str]]]:
         if path.exists():
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
-                cache = {}
-                for entry in data.get("queries", []):
-                    cache[entry["query"].lower()] = entry.get("results", [])
-                return cache
-            except json.JSONDecodeError:  # pragma: no cover
+                return _parse_cache_file(str(path), path.stat().st_mtime_ns)
+            except orjson.JSONDecodeError:  # pragma: no cover
                 LOGGER.warning("Invalid cache file, ignoring")
         return {}
 
-    def run(self, topic: str, max_sources: int | None = None) -> Dict[str, object]:
+    async def run(self, topic: str, max_sources: int | None = None) -> Dict[str, object]:
         max_sources = max_sources or self.settings.default_max_sources
-        planner_steps = self.planner.plan(topic)
+        topic_key = topic.lower().strip()
+        planner_steps = self._plan_cache.get(topic_key)
+        if planner_steps is None:
+            planner_steps = self.planner.plan(topic)
+            self._plan_cache.put(topic_key, planner_steps)
+
+        # Searches are independent I/O-bound calls: fan them out so total
+        # latency is the slowest step rather than the sum of all of them.
+        results_per_step = await asyncio.gather(
+            *(self._search_with_fallback(step) for step in planner_steps)
+        )
 
         evidence: List[Dict[str, str]] = []
         sources: List[Dict[str, str]] = []
-        for step in planner_steps:
-            query_results = self._search_with_fallback(step)
+        for query_results in results_per_step:
             for item in query_results[:max_sources]:
                 evidence.append(item)
                 sources.append(item)
 
-        summary_payload = self.summarizer.summarize(topic, evidence)
+        evidence_digest = blake2b(
+            json.dumps(evidence, sort_keys=True).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        summary_key = (topic_key, evidence_digest)
+        summary_payload = self._summary_cache.get(summary_key)
+        if summary_payload is None:
+            summary_payload = await self._summarize_batched(topic, evidence)
+            self._summary_cache.put(summary_key, summary_payload)
         insights = [
             {"heading": insight.get("heading", "Insight"), "content": insight.get("content", "")} 
             for insight in summary_payload.get("insights", [])
@@ -59,15 +140,56 @@ class ResearchOrchestrator:
             "sources": sources,
         }
 
-    def _search_with_fallback(self, query: str) -> List[Dict[str, str]]:
-        results = self.researcher.search(query)
+    async def _summarize_batched(self, topic: str, evidence: List[Dict[str, str]]) -> dict:
+        """Coalesce concurrent summarize calls into one batched agent call.
+
+        Each caller parks on a future; a lazily started worker drains the
+        queue for up to _SUMMARY_BATCH_WAIT seconds and hands the whole
+        batch to summarize_batch, amortizing per-call LLM overhead across
+        everything that arrived in the window.
+        """
+        if self._summary_queue is None:
+            self._summary_queue = asyncio.Queue()
+        if self._summary_worker is None or self._summary_worker.done():
+            self._summary_worker = asyncio.get_running_loop().create_task(self._summary_loop())
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._summary_queue.put((topic, evidence, future))
+        return await future
+
+    async def _summary_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._summary_queue.get()]
+            deadline = loop.time() + _SUMMARY_BATCH_WAIT
+            while len(batch) < _SUMMARY_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._summary_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            items = [(topic, evidence) for topic, evidence, _ in batch]
+            try:
+                payloads = await asyncio.to_thread(self.summarizer.summarize_batch, items)
+            except Exception as exc:  # pragma: no cover - propagated to callers
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, _, future), payload in zip(batch, payloads):
+                if not future.done():
+                    future.set_result(payload)
+
+    async def _search_with_fallback(self, query: str) -> List[Dict[str, str]]:
+        async with self._search_semaphore:
+            results = await self.researcher.search(query)
         if results:
             return results
         cached = self.cached_data.get(query.lower())
         if cached:
             LOGGER.info("Falling back to cached evidence for query '%s'", query)
             return cached
-        if self.cached_data:
+        if self._fallback_results:
             LOGGER.info("Using general cache fallback for query '%s'", query)
-            return next(iter(self.cached_data.values()))
-        return []
+        return self._fallback_results
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -37,6 +37,17 @@ class ResearchResponse(BaseModel):
     created_at: datetime
 
 
+class TaskSubmission(BaseModel):
+    task_id: str
+
+
+class TaskStatus(BaseModel):
+    task_id: str
+    status: str
+    result: Optional[ResearchResponse] = None
+    error: Optional[str] = None
+
+
 class ReportSummary(BaseModel):
     id: int
     topic: str
@@ -46,6 +57,29 @@ class ReportSummary(BaseModel):
 class PaginatedReports(BaseModel):
     items: List[ReportSummary]
     total: int
+    # Pass as ?before= to fetch the next page; None when this page is the last.
+    next_cursor: Optional[datetime] = None
+
+
+class BatchRequestItem(BaseModel):
+    id: str
+    method: str = "GET"
+    url: str
+    body: Optional[dict] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem]
+
+
+class BatchResponseItem(BaseModel):
+    id: str
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResponseItem]
 
 
 class HealthResponse(BaseModel):
@@ -1,70 +1,174 @@
 from __future__ import annotations
 
-import json
+import logging
+from datetime import datetime
 from typing import List, Optional
 
-from sqlmodel import Session, select
+import orjson
+from fastapi import BackgroundTasks
+from sqlalchemy import insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .config import Settings
+from .db import Database
 from .models import ResearchReport, Source
 from .orchestrator import ResearchOrchestrator
 from .schemas import Insight, PlannerStep, ResearchRequest, ResearchResponse, SourcePayload
 
+LOGGER = logging.getLogger(__name__)
+
+# Hoisted once at import: per-call chaining (.where/.limit) on these bases
+# is a cheap clause append, and the shared structure keeps SQLAlchemy's
+# compiled-query cache hitting the same entry across requests.
+_REPORT_WITH_SOURCES = select(ResearchReport).options(selectinload(ResearchReport.sources))
+_LIST_REPORTS = select(ResearchReport).order_by(ResearchReport.created_at.desc())
+_COUNT_REPORTS = select(func.count()).select_from(ResearchReport)
+
+
+class ReportNotFound(ValueError):
+    """Raised when a report id has no matching row; maps to HTTP 404."""
+
 
 class ResearchService:
     """Application service orchestrating research workflow and persistence."""
 
-    def __init__(self, settings: Settings, session: Session):
+    def __init__(
+        self,
+        settings: Settings,
+        session: AsyncSession,
+        orchestrator: ResearchOrchestrator,
+        database: Optional[Database] = None,
+    ):
         self.settings = settings
         self.session = session
-        self.orchestrator = ResearchOrchestrator(settings)
+        # Shared app-lifetime instance: constructing one here would re-read
+        # the search cache from disk and rebuild all three agents per request.
+        self.orchestrator = orchestrator
+        # Needed only for deferred persistence: the request-scoped session
+        # above is torn down before background tasks run.
+        self.database = database
+
+    async def run_research(
+        self, payload: ResearchRequest, background: Optional[BackgroundTasks] = None
+    ) -> ResearchResponse:
+        # Topics are unique: a repeat post short-circuits to the stored
+        # report before any agent work or LLM spend.
+        existing = await self._get_by_topic(payload.topic)
+        if existing is not None:
+            return self._response_from_report(existing)
+
+        result = await self.orchestrator.run(payload.topic, payload.max_sources)
+
+        created_at = datetime.utcnow()
+        insert_stmt = (
+            sqlite_insert(ResearchReport)
+            .values(
+                topic=payload.topic,
+                summary_md=result["summary_md"],
+                # orjson serializes several times faster than stdlib json and
+                # writes bytes directly; decode once for the TEXT column.
+                insights_json=orjson.dumps(result["insights"]).decode(),
+                created_at=created_at,
+            )
+            .on_conflict_do_nothing(index_elements=["topic"])
+            .returning(ResearchReport.id)
+        )
+        report_id = (await self.session.execute(insert_stmt)).scalar_one_or_none()
+        if report_id is None:
+            # Lost the race to a concurrent insert; serve the winner's row.
+            existing = await self._get_by_topic(payload.topic)
+            return self._response_from_report(existing)
+        # Commit the report row before responding so report_id is durable
+        # and /reports/{id} never 404s; only the sources fan-out below is
+        # eligible for deferral.
+        await self.session.commit()
 
-    def run_research(self, payload: ResearchRequest) -> ResearchResponse:
-        result = self.orchestrator.run(payload.topic, payload.max_sources)
+        if result["sources"]:
+            # Core bulk insert: one executemany round-trip, no per-row ORM
+            # instrumentation or identity-map bookkeeping.
+            rows = [
+                {
+                    "report_id": report_id,
+                    "title": src.get("title", "Untitled"),
+                    "url": src.get("url", ""),
+                    "snippet": src.get("snippet", ""),
+                }
+                for src in result["sources"]
+            ]
+            if background is not None and self.database is not None:
+                # Response bytes only need the in-memory result; the sources
+                # write (and its commit) happens after the reply is sent.
+                background.add_task(self._persist_sources, report_id, rows)
+            else:
+                await self.session.execute(insert(Source), rows)
+                await self.session.commit()
 
-        report = ResearchReport(
+        # model_construct skips per-field revalidation: the orchestrator
+        # already shapes these dicts, so validating them again on every
+        # response is pure CPU overhead.
+        return ResearchResponse.model_construct(
+            report_id=report_id,
             topic=payload.topic,
             summary_md=result["summary_md"],
-            insights_json=json.dumps(result["insights"]),
+            insights=[Insight.model_construct(**ins) for ins in result["insights"]],
+            sources=[SourcePayload.model_construct(**src) for src in result["sources"]],
+            planner_steps=[PlannerStep.model_construct(**step) for step in result["planner_steps"]],
+            created_at=created_at,
         )
-        self.session.add(report)
-        self.session.flush()
 
-        source_models: List[Source] = []
-        for src in result["sources"]:
-            source_models.append(Source(report_id=report.id, title=src.get("title", "Untitled"), url=src.get("url", ""), snippet=src.get("snippet", "")))
-        self.session.add_all(source_models)
-        self.session.commit()
+    async def _persist_sources(self, report_id: int, rows: List[dict]) -> None:
+        # Runs after the response is sent, by which point the request
+        # session is closed — so this opens a short-lived one of its own.
+        try:
+            async with self.database.session() as session:
+                await session.execute(insert(Source), rows)
+                await session.commit()
+        except Exception:  # pragma: no cover - logged, response already sent
+            LOGGER.exception("Deferred source persistence failed for report %s", report_id)
 
-        return ResearchResponse(
+    async def _get_by_topic(self, topic: str) -> Optional[ResearchReport]:
+        return (
+            await self.session.exec(_REPORT_WITH_SOURCES.where(ResearchReport.topic == topic))
+        ).one_or_none()
+
+    def _response_from_report(self, report: ResearchReport) -> ResearchResponse:
+        # Rows come from our own schema-enforced tables; constructing
+        # without validation avoids re-checking data we already trust.
+        return ResearchResponse.model_construct(
             report_id=report.id,
             topic=report.topic,
             summary_md=report.summary_md,
-            insights=[Insight(**ins) for ins in result["insights"]],
-            sources=[SourcePayload(**src) for src in result["sources"]],
-            planner_steps=[PlannerStep(**step) for step in result["planner_steps"]],
+            insights=[Insight.model_construct(**ins) for ins in orjson.loads(report.insights_json)],
+            sources=[
+                SourcePayload.model_construct(title=src.title, url=src.url, snippet=src.snippet)
+                for src in report.sources
+            ],
+            planner_steps=[],
             created_at=report.created_at,
         )
 
-    def list_reports(self, limit: int, offset: int) -> List[ResearchReport]:
-        query = select(ResearchReport).order_by(ResearchReport.created_at.desc()).offset(offset).limit(limit)
-        return self.session.exec(query).all()
+    async def list_reports(self, limit: int, before: Optional[datetime] = None) -> List[ResearchReport]:
+        # Keyset pagination: seeking on the indexed created_at column is
+        # O(limit) per page, where OFFSET scans and discards offset rows.
+        query = _LIST_REPORTS.limit(limit)
+        if before is not None:
+            query = query.where(ResearchReport.created_at < before)
+        return (await self.session.exec(query)).all()
 
-    def count_reports(self) -> int:
-        return len(self.session.exec(select(ResearchReport)).all())
+    async def count_reports(self) -> int:
+        # COUNT(*) in the database; hydrating every report just to len() it
+        # is O(N) in both ORM construction and I/O.
+        return (await self.session.exec(_COUNT_REPORTS)).one()
 
-    def get_report(self, report_id: int) -> ResearchResponse:
-        report = self.session.get(ResearchReport, report_id)
+    async def get_report(self, report_id: int) -> ResearchResponse:
+        # Eager-load sources with the report in a single round-trip instead
+        # of a second SELECT per call.
+        report = (
+            await self.session.exec(_REPORT_WITH_SOURCES.where(ResearchReport.id == report_id))
+        ).one_or_none()
         if not report:
-            raise ValueError(f"Report {report_id} not found")
-        sources = self.session.exec(select(Source).where(Source.report_id == report_id)).all()
-        insights = json.loads(report.insights_json)
-        return ResearchResponse(
-            report_id=report.id,
-            topic=report.topic,
-            summary_md=report.summary_md,
-            insights=[Insight(**ins) for ins in insights],
-            sources=[SourcePayload(title=src.title, url=src.url, snippet=src.snippet) for src in sources],
-            planner_steps=[],
-            created_at=report.created_at,
-        )
+            raise ReportNotFound(f"Report {report_id} not found")
+        return self._response_from_report(report)
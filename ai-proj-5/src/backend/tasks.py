@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Awaitable, Dict, Optional
+from uuid import uuid4
+
+
+class TaskRegistry:
+    """In-process registry for background research jobs.
+
+    Stands in for an external broker: this deployment has no Redis or
+    Celery, so jobs run as tasks on the server's event loop and their
+    state lives in memory (and is lost on restart). Finished records are
+    evicted oldest-first once the registry fills up.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._records: "OrderedDict[str, Dict[str, object]]" = OrderedDict()
+        self._max_entries = max_entries
+
+    def submit(self, job: Awaitable[dict]) -> str:
+        task_id = uuid4().hex
+        record: Dict[str, object] = {
+            "task_id": task_id,
+            "status": "running",
+            "result": None,
+            "error": None,
+        }
+        self._records[task_id] = record
+        while len(self._records) > self._max_entries:
+            self._records.popitem(last=False)
+
+        task = asyncio.get_running_loop().create_task(job)
+
+        def _finish(done: asyncio.Task) -> None:
+            if done.cancelled():
+                record["status"] = "cancelled"
+            elif done.exception() is not None:
+                record["status"] = "failed"
+                record["error"] = str(done.exception())
+            else:
+                record["status"] = "done"
+                record["result"] = done.result()
+
+        task.add_done_callback(_finish)
+        return task_id
+
+    def get(self, task_id: str) -> Optional[Dict[str, object]]:
+        return self._records.get(task_id)
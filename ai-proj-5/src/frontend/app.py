@@ -8,8 +8,20 @@ import streamlit as st
 DEFAULT_API_BASE = "http://localhost:8300"
 
 
+@st.cache_resource
+def _get_client(api_base: str) -> httpx.Client:
+    # Streamlit reruns the whole script on every interaction; caching the
+    # client keeps keep-alive sockets open across reruns instead of paying
+    # a fresh TCP handshake each time.
+    return httpx.Client(
+        base_url=api_base,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+
+
 def run_dashboard(api_base: str = DEFAULT_API_BASE) -> None:
-    client = httpx.Client(base_url=api_base)
+    client = _get_client(api_base)
 
     st.set_page_config(page_title="Multi-Agent Research Assistant", layout="wide")
     st.title("🔍 Multi-Agent Research Assistant")
@@ -20,11 +32,33 @@ def run_dashboard(api_base: str = DEFAULT_API_BASE) -> None:
         max_sources = st.slider("Max sources per sub-task", 1, 10, 5)
         submitted = st.form_submit_button("Run Research")
 
+    history: Optional[dict] = None
     if submitted and topic:
+        # One /batch round-trip covers the research run and the history
+        # refresh instead of two sequential calls. Members run concurrently,
+        # so the history snapshot may lag the just-created report by one
+        # rerun; Streamlit refreshes it on the next interaction.
         with st.spinner("Coordinating planner, researcher, and summarizer agents..."):
-            response = client.post("/research", json={"topic": topic, "max_sources": max_sources})
-        if response.status_code == 200:
-            data = response.json()
+            batch = client.post(
+                "/batch",
+                json={
+                    "requests": [
+                        {
+                            "id": "research",
+                            "method": "POST",
+                            "url": "/research",
+                            "body": {"topic": topic, "max_sources": max_sources},
+                        },
+                        {"id": "history", "method": "GET", "url": "/reports?limit=5"},
+                    ]
+                },
+                timeout=120.0,
+            ).json()
+        by_id = {item["id"]: item for item in batch["responses"]}
+        research = by_id["research"]
+        history = by_id["history"]["body"]
+        if research["status"] == 200:
+            data = research["body"]
             st.success("Research complete. Insight summary below.")
             st.markdown(data["summary_md"], unsafe_allow_html=True)
 
@@ -41,10 +75,11 @@ def run_dashboard(api_base: str = DEFAULT_API_BASE) -> None:
             for src in data["sources"]:
                 st.markdown(f"- [{src['title']}]({src['url']}) — {src['snippet']}")
         else:
-            st.error(response.json().get("detail", "Unknown error"))
+            st.error((research["body"] or {}).get("detail", "Unknown error"))
 
     st.divider()
-    history = client.get("/reports", params={"limit": 5}).json()
+    if history is None:
+        history = client.get("/reports", params={"limit": 5}).json()
     if history["items"]:
         st.subheader("Recent Reports")
         for item in history["items"]:
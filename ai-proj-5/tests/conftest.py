@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
 from pathlib import Path
@@ -38,7 +39,7 @@ def tmp_settings(tmp_path: Path) -> Settings:
 @pytest.fixture
 def database(tmp_settings: Settings) -> Database:
     db = Database(tmp_settings)
-    db.create_schema()
+    asyncio.run(db.create_schema())
     return db
 
 
@@ -50,5 +51,8 @@ def app(tmp_settings: Settings, database: Database):
 
 
 @pytest.fixture
-def client(app) -> TestClient:
-    return TestClient(app)
+def client(app):
+    # Context manager so the startup hook runs and creates the schema on
+    # the app's own Database.
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -30,6 +31,6 @@ def test_orchestrator_uses_cache(tmp_path):
     )
     settings = Settings(use_fake_llm=True, use_fake_search=True, data_cache_path=cache)
     orchestrator = ResearchOrchestrator(settings)
-    result = orchestrator.run("testing")
+    result = asyncio.run(orchestrator.run("testing"))
     assert result["sources"], "Should leverage cached data for fake search"
     assert "summary_md" in result